@@ -4,6 +4,7 @@ Usage: python cli.py <source_lang> <target_lang> <input_file>
 Example: python cli.py python java input.py
 """
 
+import mmap
 import sys
 from src.lexer import PythonLexer, JavaLexer, CppLexer
 from src.parser import PythonParser, JavaParser, CppParser
@@ -12,7 +13,39 @@ from src.ir import IRGenerator
 from src.codegen import PythonGenerator, JavaGenerator, CppGenerator
 
 
-def translate(source_code, source_lang, target_lang):
+# Banners, built once instead of on every print
+RULE = "=" * 80
+THIN_RULE = "-" * 80
+HEADER = "\n".join([
+    RULE,
+    " " * 28 + "SYNTAXSHIFT CLI",
+    " " * 22 + "Code Translation Tool",
+    RULE,
+])
+
+# Lexer mapping
+LEXERS = {
+    'python': PythonLexer,
+    'java': JavaLexer,
+    'cpp': CppLexer
+}
+
+# Parser mapping
+PARSERS = {
+    'python': PythonParser,
+    'java': JavaParser,
+    'cpp': CppParser
+}
+
+# Generator instances (generate() resets their state, so they are reusable)
+GENERATORS = {
+    'python': PythonGenerator(),
+    'java': JavaGenerator(),
+    'cpp': CppGenerator()
+}
+
+
+def translate(source_code, source_lang, target_lang, verbose=False):
     """
     Translate code from source language to target language.
     
@@ -20,46 +53,33 @@ def translate(source_code, source_lang, target_lang):
         source_code: Source code string
         source_lang: Source language (python, java, cpp)
         target_lang: Target language (python, java, cpp)
+        verbose: Print per-phase progress (errors are always printed)
         
     Returns:
         Translated code or None if errors occurred
     """
-    # Lexer mapping
-    lexer_map = {
-        'python': PythonLexer,
-        'java': JavaLexer,
-        'cpp': CppLexer
-    }
-    
-    # Parser mapping
-    parser_map = {
-        'python': PythonParser,
-        'java': JavaParser,
-        'cpp': CppParser
-    }
-    
-    # Generator mapping
-    generator_map = {
-        'python': PythonGenerator,
-        'java': JavaGenerator,
-        'cpp': CppGenerator
-    }
-    
     try:
         # Step 1: Lexical Analysis
-        print(f"[1/5] Lexing {source_lang} code...")
-        lexer = lexer_map[source_lang](source_code)
+        if verbose:
+            print(f"[1/5] Lexing {source_lang} code...")
+        lexer = LEXERS[source_lang](source_code)
         tokens = lexer.tokenize()
-        print(f"      Generated {len(tokens)} tokens")
+        if verbose:
+            print(f"      Generated {len(tokens)} tokens")
         
         # Step 2: Parsing
-        print(f"[2/5] Parsing...")
-        parser = parser_map[source_lang](tokens)
+        if verbose:
+            print(f"[2/5] Parsing...")
+        parser = PARSERS[source_lang](tokens)
         ast = parser.parse()
-        print(f"      Generated AST")
+        # The token list is not needed past parsing; let it be reclaimed
+        del lexer, parser, tokens
+        if verbose:
+            print(f"      Generated AST")
         
         # Step 3: Semantic Analysis
-        print(f"[3/5] Semantic analysis...")
+        if verbose:
+            print(f"[3/5] Semantic analysis...")
         checker = TypeChecker(language=source_lang)
         is_valid = checker.check(ast)
         
@@ -69,19 +89,26 @@ def translate(source_code, source_lang, target_lang):
                 print(f"        - {error}")
             return None
         
-        print(f"      No errors found")
+        if verbose:
+            print(f"      No errors found")
         
         # Step 4: IR Generation
-        print(f"[4/5] Generating IR...")
+        if verbose:
+            print(f"[4/5] Generating IR...")
         ir_gen = IRGenerator(source_language=source_lang)
         ir_program = ir_gen.generate(ast)
-        print(f"      Generated IR")
+        del ast, ir_gen, checker
+        if verbose:
+            print(f"      Generated IR")
         
         # Step 5: Code Generation
-        print(f"[5/5] Generating {target_lang} code...")
-        generator = generator_map[target_lang]()
+        if verbose:
+            print(f"[5/5] Generating {target_lang} code...")
+        generator = GENERATORS[target_lang]
         target_code = generator.generate(ir_program)
-        print(f"      Generated {len(target_code.split(chr(10)))} lines of code")
+        if verbose:
+            line_count = target_code.count("\n") + 1
+            print(f"      Generated {line_count} lines of code")
         
         return target_code
         
@@ -92,12 +119,38 @@ def translate(source_code, source_lang, target_lang):
         return None
 
 
+def read_source(path):
+    """
+    Read a source file as text.
+    
+    Regular files are memory-mapped and decoded straight from the mapping, so
+    the raw bytes are never copied into a separate bytes object first. Files
+    that cannot be mapped (empty files, pipes, /dev/stdin) are read normally.
+    
+    Args:
+        path: Path to the source file
+        
+    Returns:
+        Decoded source code with newlines normalized to '\\n'
+    """
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                source_code = str(mm, 'utf-8')
+        except (OSError, ValueError):
+            # Empty files cannot be mapped, nor can pipes, FIFOs or /dev/stdin;
+            # read those the ordinary way
+            source_code = f.read().decode('utf-8')
+    
+    # Match text-mode universal newline handling
+    if '\r' in source_code:
+        source_code = source_code.replace('\r\n', '\n').replace('\r', '\n')
+    return source_code
+
+
 def main():
     """Main CLI entry point."""
-    print("="*80)
-    print(" " * 28 + "SYNTAXSHIFT CLI")
-    print(" " * 22 + "Code Translation Tool")
-    print("="*80)
+    print(HEADER)
     
     if len(sys.argv) < 4:
         print("\nUsage: python cli.py <source_lang> <target_lang> <input_file>")
@@ -126,8 +179,7 @@ def main():
     
     # Read input file
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            source_code = f.read()
+        source_code = read_source(input_file)
     except FileNotFoundError:
         print(f"ERROR: File not found: {input_file}")
         sys.exit(1)
@@ -137,19 +189,19 @@ def main():
     
     print(f"\nTranslating: {source_lang.upper()} -> {target_lang.upper()}")
     print(f"Input file: {input_file}")
-    print("-"*80)
+    print(THIN_RULE)
     
     # Translate
-    result = translate(source_code, source_lang, target_lang)
+    result = translate(source_code, source_lang, target_lang, verbose=True)
     
     if result:
-        print("\n" + "="*80)
+        print("\n" + RULE)
         print("TRANSLATION SUCCESSFUL")
-        print("="*80)
+        print(RULE)
         print("\nGenerated Code:")
-        print("-"*80)
+        print(THIN_RULE)
         print(result)
-        print("-"*80)
+        print(THIN_RULE)
         
         # Save output
         output_file = f"output.{target_lang}"
@@ -165,9 +217,9 @@ def main():
         
         print(f"\nOutput saved to: {output_file}")
     else:
-        print("\n" + "="*80)
+        print("\n" + RULE)
         print("TRANSLATION FAILED")
-        print("="*80)
+        print(RULE)
         sys.exit(1)
 
 
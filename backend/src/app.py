@@ -3,6 +3,9 @@ from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 import sys
 import os
+import asyncio
+import threading
+from functools import lru_cache
 
 # Add parent directory to path to allow importing modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,6 +18,61 @@ from src.codegen import PythonGenerator, JavaGenerator, CppGenerator
 
 app = FastAPI(title="SyntaxShift Compiler API")
 
+# Pipeline components by language, built once at import
+LEXERS = {
+    'python': PythonLexer,
+    'java': JavaLexer,
+    'cpp': CppLexer
+}
+
+PARSERS = {
+    'python': PythonParser,
+    'java': JavaParser,
+    'cpp': CppParser
+}
+
+GENERATOR_CLASSES = {
+    'python': PythonGenerator,
+    'java': JavaGenerator,
+    'cpp': CppGenerator
+}
+
+# Pipeline objects are reusable once reset, but not safe to share between
+# FastAPI's worker threads, so each thread keeps its own instance per
+# (component, language)
+_local = threading.local()
+
+
+def _thread_cached(key: tuple, factory):
+    """Return this thread's cached instance for key, creating it on first use."""
+    components = getattr(_local, 'components', None)
+    if components is None:
+        components = _local.components = {}
+    obj = components.get(key)
+    if obj is None:
+        obj = components[key] = factory()
+    return obj
+
+
+def get_checker(source_lang: str) -> TypeChecker:
+    """Return this thread's type checker for the language, reset for reuse."""
+    checker = _thread_cached(('checker', source_lang), lambda: TypeChecker(language=source_lang))
+    checker.reset()
+    return checker
+
+
+def get_ir_generator(source_lang: str) -> IRGenerator:
+    """Return this thread's IR generator for the language, reset for reuse."""
+    ir_gen = _thread_cached(('ir', source_lang), lambda: IRGenerator(source_language=source_lang))
+    ir_gen.reset()
+    return ir_gen
+
+
+def get_generator(target_lang: str):
+    """Return this thread's code generator for the target language."""
+    # generate() resets the generator's own state
+    return _thread_cached(('generator', target_lang), GENERATOR_CLASSES[target_lang])
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -24,6 +82,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@lru_cache(maxsize=16)
+def resolve_languages(source_language: str, target_language: str):
+    """
+    Normalize requested language names and look up the source pipeline classes.
+    Cached since requests only ever use a handful of language combinations.
+    
+    Returns:
+        (source_lang, target_lang, lexer_cls, parser_cls); the classes are
+        None when the source language is unsupported
+    """
+    source_lang = source_language.lower()
+    target_lang = target_language.lower()
+    return source_lang, target_lang, LEXERS.get(source_lang), PARSERS.get(source_lang)
+
+
 class ConversionRequest(BaseModel):
     source_code: str
     source_language: str
@@ -36,42 +109,58 @@ class ConversionResponse(BaseModel):
     ast: dict = {}
     ir: dict = {}
 
+class BatchConversionRequest(BaseModel):
+    items: list[ConversionRequest]
+
+class BatchConversionResponse(BaseModel):
+    results: list[ConversionResponse]
+
 @app.get("/")
 def health_check():
     return {"status": "ok", "version": "1.0.0"}
 
+_HEALTH_BODY = b'{"status":"ok","version":"1.0.0"}'
+_HEALTH_HEADERS = [
+    (b'content-type', b'application/json'),
+    (b'content-length', str(len(_HEALTH_BODY)).encode()),
+]
+
+class HealthEndpoint:
+    """
+    Raw ASGI liveness endpoint for probes.
+    Sends a prebuilt response without request parsing or model validation.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        await send({'type': 'http.response.start', 'status': 200, 'headers': _HEALTH_HEADERS})
+        await send({'type': 'http.response.body', 'body': _HEALTH_BODY})
+
+# A class instance (not a function) is mounted as a plain ASGI app
+app.add_route("/health", HealthEndpoint(), methods=["GET"], include_in_schema=False)
+
 @app.post("/convert", response_model=ConversionResponse)
 def convert_code(request: ConversionRequest):
+    checker = ir_gen = None
     try:
-        source_lang = request.source_language.lower()
-        target_lang = request.target_language.lower()
+        source_lang, target_lang, lexer_cls, parser_cls = resolve_languages(
+            request.source_language, request.target_language)
         code = request.source_code
 
         # 1. Lexer
-        lexer_map = {
-            'python': PythonLexer,
-            'java': JavaLexer,
-            'cpp': CppLexer
-        }
-        
-        if source_lang not in lexer_map:
+        if lexer_cls is None:
             raise HTTPException(status_code=400, detail=f"Unsupported source language: {source_lang}")
             
-        lexer = lexer_map[source_lang](code)
+        lexer = lexer_cls(code)
         tokens = lexer.tokenize()
         
         # 2. Parser
-        parser_map = {
-            'python': PythonParser,
-            'java': JavaParser,
-            'cpp': CppParser
-        }
-        
-        parser = parser_map[source_lang](tokens)
+        parser = parser_cls(tokens)
         ast = parser.parse()
+        # The token list is not needed past parsing; let it be reclaimed
+        del lexer, parser, tokens
         
         # 3. Semantic Analysis
-        checker = TypeChecker(language=source_lang)
+        checker = get_checker(source_lang)
         is_valid = checker.check(ast)
         
         if not is_valid:
@@ -79,20 +168,14 @@ def convert_code(request: ConversionRequest):
             return ConversionResponse(success=False, error=f"Semantic Errors:\n{errors}")
             
         # 4. IR Generation
-        ir_gen = IRGenerator(source_language=source_lang)
+        ir_gen = get_ir_generator(source_lang)
         ir_program = ir_gen.generate(ast)
         
         # 5. Code Generation
-        generator_map = {
-            'python': PythonGenerator,
-            'java': JavaGenerator,
-            'cpp': CppGenerator
-        }
-        
-        if target_lang not in generator_map:
+        if target_lang not in GENERATOR_CLASSES:
             raise HTTPException(status_code=400, detail=f"Unsupported target language: {target_lang}")
             
-        generator = generator_map[target_lang]()
+        generator = get_generator(target_lang)
         target_code = generator.generate(ir_program)
         
         return ConversionResponse(
@@ -106,6 +189,22 @@ def convert_code(request: ConversionRequest):
         import traceback
         traceback.print_exc()
         return ConversionResponse(success=False, error=str(e))
+    finally:
+        # The pooled checker and IR generator outlive this request; drop its
+        # symbol table and IR now rather than when the thread next uses them
+        if checker is not None:
+            checker.reset()
+        if ir_gen is not None:
+            ir_gen.reset()
+
+@app.post("/convert_batch", response_model=BatchConversionResponse)
+async def convert_batch(request: BatchConversionRequest):
+    # Each item runs on a worker thread, which reuses that thread's cached
+    # pipeline objects across the items it handles
+    results = await asyncio.gather(
+        *(asyncio.to_thread(convert_code, item) for item in request.items)
+    )
+    return BatchConversionResponse(results=results)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,30 +1,67 @@
 """
-Base Code Generator - Abstract base class for all code generators.
+Base Code Generator - Base class for all code generators.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Optional
+import io
+from typing import Iterable, List, Optional, TextIO
 from ..ir.ir_nodes import *
 from ..utils import format_code
 
 
-class BaseGenerator(ABC):
+# Prebuilt indent strings for the default indent size of 4 spaces
+_INDENTS = tuple(' ' * (i * 4) for i in range(64))
+
+# Expression nodes whose visitors only return a string and never emit
+_PURE_EXPRESSIONS = frozenset({IRNodeType.LITERAL, IRNodeType.IDENTIFIER})
+
+
+class BaseGenerator:
     """
-    Abstract base class for code generators.
+    Base class for code generators.
     Generates target language code from IR.
     """
     
-    def __init__(self, target_language: str):
+    __slots__ = ('target_language', 'indent_size', 'indent_level',
+                 '_out', '_buf', '_sep', '_indent_str', '_dispatch')
+    
+    def __init__(self, target_language: str, out: Optional[TextIO] = None):
         """
         Initialize code generator.
         
         Args:
             target_language: Target language name
+            out: Stream to write generated code to; by default code is
+                collected in memory and returned by generate()
         """
         self.target_language = target_language
-        self.indent_level = 0
         self.indent_size = 4
-        self.generated_code = []
+        self._out = out
+        self._reset_output()
+        
+        self._dispatch = self._visitor_table()
+    
+    @classmethod
+    def _visitor_table(cls) -> dict:
+        """
+        Get the IRNodeType -> visit_* function table for this class.
+        Built on first use and shared by every instance of the class.
+        """
+        table = cls.__dict__.get('_visitors')
+        if table is None:
+            table = {}
+            for node_type in IRNodeType:
+                visitor = getattr(cls, f"visit_{node_type.value}", None)
+                if visitor is not None:
+                    table[node_type] = visitor
+            cls._visitors = table
+        return table
+    
+    def _reset_output(self) -> None:
+        """Start a fresh output buffer at indentation level 0."""
+        self._buf = io.StringIO() if self._out is None else self._out
+        self._sep = ''
+        self.indent_level = 0
+        self._indent_str = ''
     
     def generate(self, ir_program: IRProgram) -> str:
         """
@@ -34,10 +71,9 @@ class BaseGenerator(ABC):
             ir_program: IR program node
             
         Returns:
-            Generated code as string
+            Generated code as string, or "" if it was written to `out`
         """
-        self.generated_code = []
-        self.indent_level = 0
+        self._reset_output()
         
         # Generate imports/headers
         self.generate_imports()
@@ -58,7 +94,31 @@ class BaseGenerator(ABC):
         if ir_program.main_body:
             self.generate_main(ir_program.main_body)
         
-        return '\n'.join(self.generated_code)
+        return self._result()
+    
+    def generate_to_file(self, ir_program: IRProgram, path: str) -> None:
+        """
+        Generate code from IR program and save it to a file.
+        
+        The code is collected in memory and written with a single write call,
+        even if the generator was created with an `out` stream.
+        
+        Args:
+            ir_program: IR program node
+            path: Path of the file to write
+        """
+        out, self._out = self._out, None
+        try:
+            code = self.generate(ir_program)
+        finally:
+            self._out = out
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(code)
+    
+    def _result(self) -> str:
+        """Return the code collected in memory, or "" when streaming to `out`."""
+        return self._buf.getvalue() if self._out is None else ""
 
     def generate_main(self, statements: List[IRNode]) -> None:
         """
@@ -68,7 +128,7 @@ class BaseGenerator(ABC):
         """
         for stmt in statements:
             code = self.visit(stmt)
-            if code and code.strip():
+            if code:
                 self.emit(code)
     
     def visit(self, node: IRNode) -> str:
@@ -84,14 +144,25 @@ class BaseGenerator(ABC):
         if node is None:
             return ""
         
-        method_name = f"visit_{node.node_type.value}"
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        try:
+            visitor = self._dispatch[node.node_type]
+        except KeyError:
+            return self.generic_visit(node)
+        return visitor(self, node)
     
     def generic_visit(self, node: IRNode) -> str:
         """Generic visitor for unknown node types."""
         return ""
     
+    def _visit_args(self, nodes: List[IRNode]) -> str:
+        """Render argument nodes as a comma-separated list, skipping the join for 0 or 1 args."""
+        n = len(nodes)
+        if n == 0:
+            return ""
+        if n == 1:
+            return self.visit(nodes[0])
+        return ', '.join(map(self.visit, nodes))
+    
     def emit(self, code: str) -> None:
         """
         Emit a line of code with proper indentation.
@@ -99,94 +170,107 @@ class BaseGenerator(ABC):
         Args:
             code: Code to emit
         """
-        if code.strip():
-            indent = ' ' * (self.indent_level * self.indent_size)
-            self.generated_code.append(indent + code)
-        else:
-            self.generated_code.append('')
+        buf = self._buf
+        buf.write(self._sep)
+        self._sep = '\n'
+        if code and not code.isspace():
+            buf.write(self._indent_str)
+            buf.write(code)
+    
+    def emit_lines(self, lines: Iterable[str]) -> None:
+        """
+        Emit several lines at the current indentation with a single write.
+        
+        Args:
+            lines: Lines of code, formatted exactly as for emit()
+        """
+        indent = self._indent_str
+        lines = [indent + code if code and not code.isspace() else ''
+                 for code in lines]
+        if lines:
+            self._buf.write(self._sep + '\n'.join(lines))
+            self._sep = '\n'
     
     def indent(self) -> None:
         """Increase indentation level."""
         self.indent_level += 1
+        self._indent_str = self._indent_for(self.indent_level)
     
     def dedent(self) -> None:
         """Decrease indentation level."""
         self.indent_level = max(0, self.indent_level - 1)
+        self._indent_str = self._indent_for(self.indent_level)
+    
+    def _indent_for(self, level: int) -> str:
+        """Get the indent string for a level, using the prebuilt table when possible."""
+        if level < len(_INDENTS) and self.indent_size == 4:
+            return _INDENTS[level]
+        return ' ' * (level * self.indent_size)
     
-    # Abstract methods to be implemented by subclasses
+    # Methods to be implemented by subclasses
     
-    @abstractmethod
     def generate_imports(self) -> None:
         """Generate import statements."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_function(self, node: IRFunction) -> str:
         """Generate function definition."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_class(self, node: IRClass) -> str:
         """Generate class definition."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_variable(self, node: IRVariable) -> str:
         """Generate variable declaration."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_assignment(self, node: IRAssignment) -> str:
         """Generate assignment statement."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_if(self, node: IRIf) -> str:
         """Generate if statement."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_while(self, node: IRWhile) -> str:
         """Generate while loop."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_for(self, node: IRFor) -> str:
         """Generate for loop."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_return(self, node: IRReturn) -> str:
         """Generate return statement."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_call(self, node: IRCall) -> str:
         """Generate function call."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_binary_op(self, node: IRBinaryOp) -> str:
         """Generate binary operation."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_unary_op(self, node: IRUnaryOp) -> str:
         """Generate unary operation."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_literal(self, node: IRLiteral) -> str:
         """Generate literal value."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def visit_identifier(self, node: IRIdentifier) -> str:
         """Generate identifier."""
-        pass
+        raise NotImplementedError
     
     def visit_block(self, node: IRBlock) -> str:
         """Generate block of statements."""
+        visit = self.visit
         for statement in node.statements:
-            self.visit(statement)
+            # A bare literal/identifier statement emits nothing and its
+            # result is discarded here, so skip dispatching it at all
+            if statement is not None and statement.node_type not in _PURE_EXPRESSIONS:
+                visit(statement)
         return ""
@@ -2,16 +2,75 @@
 C++ Code Generator - Generates C++ code from IR.
 """
 
-from typing import List
+from typing import Dict, Hashable, List, Optional, TextIO, Tuple
 from .base_generator import BaseGenerator
 from ..ir.ir_nodes import *
 
 
+# IR type -> C++ type
+_TYPE_MAP = {
+    IRType.INT: 'int',
+    IRType.FLOAT: 'double',
+    IRType.STRING: 'string',
+    IRType.BOOL: 'bool',
+    IRType.VOID: 'void',
+    IRType.ARRAY: 'vector<int>',
+    IRType.OBJECT: 'void*',
+    IRType.ANY: 'auto'
+}
+
+# Common function names mapped to C++ equivalents
+_FUNC_MAP = {
+    'print': 'cout',
+    'len': 'size',
+    'str': 'to_string',
+    'float': 'stof',
+}
+
+# Binary operators
+_BINOP_MAP = {
+    'and': '&&',
+    'or': '||',
+    '//': '/',  # Integer division
+}
+
+# Unary operators
+_UNOP_MAP = {
+    'not': '!',
+}
+
+# Characters that must be escaped inside a C++ string literal
+_CPP_ESCAPE = str.maketrans({
+    '"': '\\"',
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\t': '\\t',
+    '\r': '\\r',
+})
+
+# Literal renderers by type; other types print via str(), None as nullptr
+_LITERAL_RENDERERS = {
+    IRType.STRING: lambda value: '"' + str(value).translate(_CPP_ESCAPE) + '"',
+    IRType.BOOL: lambda value: 'true' if value else 'false',
+    IRType.VOID: lambda value: 'nullptr',
+}
+
+
 class CppGenerator(BaseGenerator):
     """Generates C++ code from IR."""
     
-    def __init__(self):
-        super().__init__("cpp")
+    __slots__ = ('_pending_prompt', '_lit_cache')
+    
+    def __init__(self, out: Optional[TextIO] = None):
+        super().__init__("cpp", out)
+    
+    def _reset_output(self) -> None:
+        """Start a fresh output buffer and forget any unconsumed input prompt."""
+        super()._reset_output()
+        # Prompt of an input() call, printed by the variable that reads it
+        self._pending_prompt: Optional[str] = None
+        # Rendered literals keyed by (literal_type, value type, value)
+        self._lit_cache: Dict[Tuple[IRType, type, Hashable], str] = {}
     
     def generate_imports(self) -> None:
         """Generate C++ includes."""
@@ -25,28 +84,34 @@ class CppGenerator(BaseGenerator):
         self.emit("int main() {")
         self.indent()
         
+        visit, emit = self.visit, self.emit
         for stmt in statements:
-            code = self.visit(stmt)
-            if code and code.strip():
-                self.emit(code + ";")
+            code = visit(stmt)
+            if code:
+                emit(code + ";")
             
         self.emit("return 0;")
         self.dedent()
         self.emit("}")
     
+    def _emit_braced(self, header: str, body: Optional[List[IRNode]]) -> None:
+        """Emit `header {`, the indented statements of body, and `}`."""
+        if not body:
+            self.emit_lines((header + " {", "}"))
+            return
+        visit, emit = self.visit, self.emit
+        emit(header + " {")
+        self.indent()
+        for statement in body:
+            code = visit(statement)
+            if code:
+                emit(code + ";")
+        self.dedent()
+        emit("}")
+    
     def map_type(self, ir_type: IRType) -> str:
         """Map IR type to C++ type."""
-        type_map = {
-            IRType.INT: 'int',
-            IRType.FLOAT: 'double',
-            IRType.STRING: 'string',
-            IRType.BOOL: 'bool',
-            IRType.VOID: 'void',
-            IRType.ARRAY: 'vector<int>',
-            IRType.OBJECT: 'void*',
-            IRType.ANY: 'auto'
-        }
-        return type_map.get(ir_type, 'auto')
+        return _TYPE_MAP.get(ir_type, 'auto')
     
     def visit_function(self, node: IRFunction) -> str:
         """Generate C++ function."""
@@ -62,51 +127,36 @@ class CppGenerator(BaseGenerator):
         
         cpp_return_type = self.map_type(return_type)
         
-        # Parameters - filter out 'self' for methods
-        params = []
-        for param_name, param_type in node.parameters:
-            # Skip 'self' parameter (Python methods)
-            if param_name == 'self':
-                continue
-            cpp_type = self.map_type(param_type) if isinstance(param_type, IRType) else 'auto'
-            params.append(f"{cpp_type} {param_name}")
-        params_str = ', '.join(params) if params else ''
+        # Parameters - skip 'self' (Python methods)
+        map_type = self.map_type
+        params_str = ', '.join([
+            f"{map_type(param_type)} {param_name}"
+            for param_name, param_type in node.parameters
+            if param_name != 'self'
+        ])
         
-        # Function signature
-        self.emit(f"{cpp_return_type} {node.name}({params_str}) {{")
-        
-        # Function body
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-        self.dedent()
-        
-        self.emit("}")
+        # Function signature and body
+        self._emit_braced(f"{cpp_return_type} {node.name}({params_str})", node.body)
         self.emit("")  # Blank line
         return ""
     
     def visit_class(self, node: IRClass) -> str:
         """Generate C++ class."""
-        # Class definition
+        # Class definition and public section
         if node.base_classes:
             bases = ', '.join([f"public {base}" for base in node.base_classes])
-            self.emit(f"class {node.name} : {bases} {{")
+            header = f"class {node.name} : {bases} {{"
         else:
-            self.emit(f"class {node.name} {{")
-        
-        # Public section
-        self.emit("public:")
+            header = f"class {node.name} {{"
+        self.emit_lines((header, "public:"))
         self.indent()
         
-        # Class fields
+        # Class fields, followed by a blank line
         if node.fields:
-            for field in node.fields:
-                field_type = self.map_type(field.var_type)
-                self.emit(f"{field_type} {field.name};")
-            self.emit("")  # Blank line after fields
+            map_type = self.map_type
+            lines = [f"{map_type(field.var_type)} {field.name};" for field in node.fields]
+            lines.append("")
+            self.emit_lines(lines)
         
         # Class methods
         if node.methods:
@@ -114,8 +164,7 @@ class CppGenerator(BaseGenerator):
                 self.visit(method)
         
         self.dedent()
-        self.emit("};")
-        self.emit("")  # Blank line after class
+        self.emit_lines(("};", ""))  # Closing brace and blank line
         return ""
     
     def visit_variable(self, node: IRVariable) -> str:
@@ -128,16 +177,16 @@ class CppGenerator(BaseGenerator):
             # Handle special input markers
             if value == "INPUT_INT":
                 # Generate: cout << prompt; int var; cin >> var;
-                if hasattr(self, '_current_input_prompt'):
-                    self.emit(f"cout << {self._current_input_prompt};")
-                    delattr(self, '_current_input_prompt')
+                if self._pending_prompt is not None:
+                    self.emit(f"cout << {self._pending_prompt};")
+                    self._pending_prompt = None
                 self.emit(f"{var_type} {node.name};")
                 self.emit(f"cin >> {node.name};")
             elif value == "INPUT_STRING":
                 # Generate: cout << prompt; string var; getline(cin, var);
-                if hasattr(self, '_current_input_prompt'):
-                    self.emit(f"cout << {self._current_input_prompt};")
-                    delattr(self, '_current_input_prompt')
+                if self._pending_prompt is not None:
+                    self.emit(f"cout << {self._pending_prompt};")
+                    self._pending_prompt = None
                 self.emit(f"{var_type} {node.name};")
                 self.emit(f"getline(cin, {node.name});")
             else:
@@ -154,74 +203,32 @@ class CppGenerator(BaseGenerator):
     
     def visit_if(self, node: IRIf) -> str:
         """Generate C++ if statement."""
-        condition = self.visit(node.condition)
-        self.emit(f"if ({condition}) {{")
+        visit, emit_braced = self.visit, self._emit_braced
+        emit_braced(f"if ({visit(node.condition)})", node.then_block)
         
-        self.indent()
-        if node.then_block:
-            for statement in node.then_block:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-        self.dedent()
-        self.emit("}")
+        # Most ifs have neither elif nor else
+        if not node.elif_blocks and not node.else_block:
+            return ""
         
         # elif blocks (else if in C++)
         for elif_cond, elif_body in node.elif_blocks:
-            elif_condition = self.visit(elif_cond)
-            self.emit(f"else if ({elif_condition}) {{")
-            self.indent()
-            if elif_body:
-                for statement in elif_body:
-                    code = self.visit(statement)
-                    if code and code.strip():
-                        self.emit(code + ";")
-            self.dedent()
-            self.emit("}")
+            emit_braced(f"else if ({visit(elif_cond)})", elif_body)
         
         # else block
         if node.else_block:
-            self.emit("else {")
-            self.indent()
-            for statement in node.else_block:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-            self.dedent()
-            self.emit("}")
+            emit_braced("else", node.else_block)
         
         return ""
     
     def visit_while(self, node: IRWhile) -> str:
         """Generate C++ while loop."""
-        condition = self.visit(node.condition)
-        self.emit(f"while ({condition}) {{")
-        
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-        self.dedent()
-        self.emit("}")
-        
+        self._emit_braced(f"while ({self.visit(node.condition)})", node.body)
         return ""
     
     def visit_for(self, node: IRFor) -> str:
         """Generate C++ for loop (range-based)."""
         iterable = self.visit(node.iterable)
-        self.emit(f"for (auto {node.variable} : {iterable}) {{")
-        
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-        self.dedent()
-        self.emit("}")
-        
+        self._emit_braced(f"for (auto {node.variable} : {iterable})", node.body)
         return ""
     
     def visit_return(self, node: IRReturn) -> str:
@@ -240,23 +247,29 @@ class CppGenerator(BaseGenerator):
     
     def visit_call(self, node: IRCall) -> str:
         """Generate C++ function call."""
-        # Handle array access hack from parser
-        if node.function_name.endswith('[]'):
-            real_name = node.function_name[:-2]
-            if node.arguments:
-                index = self.visit(node.arguments[0])
-                return f"{real_name}[{index}]"
-            return f"{real_name}[]"
+        # Builtins that need special C++ handling
+        handler = self._CALL_HANDLERS.get(node.function_name)
+        if handler is not None:
+            return handler(self, node)
         
         # Handle method calls (object.method)
-        if '.' in node.function_name:
+        if node.is_method_call:
             # This is a method call: object.method(args)
-            args = ', '.join([self.visit(arg) for arg in node.arguments])
+            args = self._visit_args(node.arguments)
             return f"{node.function_name}({args})"
-
-        # Special handling for int(input("prompt")) pattern
+        
+        return self._visit_plain_call(node)
+    
+    def _visit_plain_call(self, node: IRCall) -> str:
+        """Generate a call, mapping common function names to C++ equivalents."""
+        args = self._visit_args(node.arguments)
+        func_name = _FUNC_MAP.get(node.function_name, node.function_name)
+        return f"{func_name}({args})"
+    
+    def _visit_int_call(self, node: IRCall) -> str:
+        """Generate int(...), reading an integer for the int(input("prompt")) pattern."""
         # This is a common Python pattern that needs special C++ handling
-        if node.function_name == 'int' and len(node.arguments) == 1:
+        if len(node.arguments) == 1:
             arg = node.arguments[0]
             if isinstance(arg, IRCall) and arg.function_name == 'input':
                 # For int(input("prompt")), we need to:
@@ -266,34 +279,37 @@ class CppGenerator(BaseGenerator):
                 if arg.arguments:
                     prompt = self.visit(arg.arguments[0])
                     # Store the prompt for later use
-                    self._current_input_prompt = prompt
+                    self._pending_prompt = prompt
                 return "INPUT_INT"
-        
-        args = ', '.join([self.visit(arg) for arg in node.arguments])
-        
-        # Map common function names
-        func_map = {
-            'print': 'cout',
-            'len': 'size',
-            'str': 'to_string',
-            'float': 'stof',
-        }
-        func_name = func_map.get(node.function_name, node.function_name)
-        
-        # Special handling for cout
-        if func_name == 'cout':
-            if args:
-                return f"cout << {args} << endl"
-            return "cout << endl"
-            
-        # Special handling for input (when not wrapped in int())
-        if node.function_name == 'input':
-            # For string input
-            if args:
-                self._current_input_prompt = args
-            return "INPUT_STRING"
-        
-        return f"{func_name}({args})"
+        return self._visit_plain_call(node)
+    
+    def _visit_print_call(self, node: IRCall) -> str:
+        """Generate print(...) as a cout statement."""
+        args = self._visit_args(node.arguments)
+        if args:
+            return f"cout << {args} << endl"
+        return "cout << endl"
+    
+    def _visit_input_call(self, node: IRCall) -> str:
+        """Generate input(...) when not wrapped in int() (string input)."""
+        args = self._visit_args(node.arguments)
+        if args:
+            self._pending_prompt = args
+        return "INPUT_STRING"
+    
+    # Function name -> call handler for builtins with special C++ handling
+    _CALL_HANDLERS = {
+        'int': _visit_int_call,
+        'print': _visit_print_call,
+        'cout': _visit_print_call,
+        'input': _visit_input_call,
+    }
+    
+    def visit_index_op(self, node: IRIndexOp) -> str:
+        """Generate C++ array access."""
+        if node.index is None:
+            return f"{node.target}[]"
+        return f"{node.target}[{self.visit(node.index)}]"
     
     def visit_binary_op(self, node: IRBinaryOp) -> str:
         """Generate C++ binary operation."""
@@ -301,12 +317,7 @@ class CppGenerator(BaseGenerator):
         right = self.visit(node.right)
         
         # Map operators
-        op_map = {
-            'and': '&&',
-            'or': '||',
-            '//': '/',  # Integer division
-        }
-        operator = op_map.get(node.operator, node.operator)
+        operator = _BINOP_MAP.get(node.operator, node.operator)
         
         return f"({left} {operator} {right})"
     
@@ -315,27 +326,30 @@ class CppGenerator(BaseGenerator):
         operand = self.visit(node.operand)
         
         # Map operators
-        op_map = {
-            'not': '!',
-        }
-        operator = op_map.get(node.operator, node.operator)
+        operator = _UNOP_MAP.get(node.operator, node.operator)
         
         return f"{operator}{operand}"
     
     def visit_literal(self, node: IRLiteral) -> str:
-        """Generate C++ literal."""
-        if node.literal_type == IRType.STRING:
-            # Escape quotes
-            value = str(node.value).replace('"', '\\"')
-            return f'"{value}"'
-        elif node.literal_type == IRType.BOOL:
-            return 'true' if node.value else 'false'
-        elif node.literal_type == IRType.VOID or node.value is None:
-            return 'nullptr'
-        elif node.literal_type == IRType.FLOAT:
-            return f"{node.value}"
-        else:
-            return str(node.value)
+        """Generate C++ literal, reusing the rendering of repeated values."""
+        value = node.value
+        # The value's type is part of the key so 1, 1.0 and True stay distinct
+        key = (node.literal_type, type(value), value)
+        try:
+            cached = self._lit_cache.get(key)
+        except TypeError:
+            # Unhashable value; render it without caching
+            return self._render_literal(node)
+        if cached is None:
+            cached = self._lit_cache[key] = self._render_literal(node)
+        return cached
+    
+    def _render_literal(self, node: IRLiteral) -> str:
+        """Render a C++ literal."""
+        render = _LITERAL_RENDERERS.get(node.literal_type)
+        if render is not None:
+            return render(node.value)
+        return 'nullptr' if node.value is None else str(node.value)
     
     def visit_identifier(self, node: IRIdentifier) -> str:
         """Generate C++ identifier."""
@@ -2,16 +2,72 @@
 Java Code Generator - Generates Java code from IR.
 """
 
-from typing import List
+import io
+from itertools import chain
+from typing import Dict, Hashable, Iterable, List, Optional, TextIO, Tuple
 from .base_generator import BaseGenerator
 from ..ir.ir_nodes import *
 
 
+# IR type -> Java type
+_TYPE_MAP = {
+    IRType.INT: 'int',
+    IRType.FLOAT: 'double',
+    IRType.STRING: 'String',
+    IRType.BOOL: 'boolean',
+    IRType.VOID: 'void',
+    IRType.ARRAY: 'Object[]',
+    IRType.OBJECT: 'Object',
+    IRType.ANY: 'var'  # Use var for type inference (Java 10+)
+}
+
+# Common function names mapped to Java equivalents
+_FUNC_MAP = {
+    'print': 'System.out.println',
+    'len': 'length',
+    'input': 'scanner.nextLine',
+    'read_input': 'scanner.nextLine',
+    'int': 'Integer.parseInt',
+    'stoi': 'Integer.parseInt',
+    'str': 'String.valueOf',
+    'to_string': 'String.valueOf',
+    'float': 'Double.parseDouble',
+    'stof': 'Double.parseDouble',
+    'size': 'length',
+    'length': 'length',
+}
+
+# Binary operators
+_BINOP_MAP = {
+    'and': '&&',
+    'or': '||',
+    '//': '/',  # Integer division in Java
+}
+
+# Unary operators
+_UNOP_MAP = {
+    'not': '!',
+}
+
+# Rendering of a cout endl argument
+_ENDL = '"\\n"'
+
+
 class JavaGenerator(BaseGenerator):
     """Generates Java code from IR."""
     
-    def __init__(self):
-        super().__init__("java")
+    __slots__ = ('_uses_scanner', '_lit_cache')
+    
+    def __init__(self, out: Optional[TextIO] = None):
+        super().__init__("java", out)
+    
+    def _reset_output(self) -> None:
+        """Start a fresh output buffer and clear per-run state."""
+        super()._reset_output()
+        # Set by visit_call when generated code reads from the Scanner
+        self._uses_scanner = False
+        # Rendered literals keyed by (literal_type, value type, value)
+        self._lit_cache: Dict[Tuple[IRType, type, Hashable], str] = {}
         
     def generate_imports(self) -> None:
         """Generate Java imports."""
@@ -21,10 +77,10 @@ class JavaGenerator(BaseGenerator):
 
     def generate(self, ir_program: IRProgram) -> str:
         """Override generate to wrap in Main class."""
-        self.generated_code = []
-        self.indent_level = 0
+        self._reset_output()
         
-        self.generate_imports()
+        # No generate_imports() call: Java needs no imports (Scanner is
+        # fully qualified in generate_main)
         
         # Generate standalone classes first (outside Main)
         for cls in ir_program.classes:
@@ -43,55 +99,51 @@ class JavaGenerator(BaseGenerator):
             
         # Generate main body
         if ir_program.main_body or ir_program.globals:
-            self.generate_main(ir_program.globals + ir_program.main_body)
+            self.generate_main(chain(ir_program.globals, ir_program.main_body))
             
         self.dedent()
         self.emit("}")
         
-        return '\n'.join(self.generated_code)
+        return self._result()
 
-    def generate_main(self, statements: List[IRNode]) -> None:
+    def generate_main(self, statements: Iterable[IRNode]) -> None:
         """Generate Java main method."""
         self.emit("public static void main(String[] args) {")
         self.indent()
         
-        # Check if we need Scanner (look for input calls)
-        needs_scanner = self._needs_scanner(statements)
-        if needs_scanner:
-            self.emit("java.util.Scanner scanner = new java.util.Scanner(System.in);")
-        
+        # Generate the body first; visit_call records whether it reads input
+        self._uses_scanner = False
+        out, self._buf = self._buf, io.StringIO()
+        visit, emit = self.visit, self.emit
         for stmt in statements:
-            code = self.visit(stmt)
-            if code and code.strip():
-                self.emit(code + ";")
+            code = visit(stmt)
+            if code:
+                emit(code + ";")
+        body, self._buf = self._buf.getvalue(), out
         
-        if needs_scanner:
+        if self._uses_scanner:
+            self.emit("java.util.Scanner scanner = new java.util.Scanner(System.in);")
+        self._buf.write(body)
+        if self._uses_scanner:
             self.emit("scanner.close();")
         self.dedent()
         self.emit("}")
-    
-    def _needs_scanner(self, statements: List[IRNode]) -> bool:
-        """Check if any statement uses input functions."""
-        for stmt in statements:
-            if self._contains_input_call(stmt):
-                return True
-        return False
-    
-    def _contains_input_call(self, node: IRNode) -> bool:
-        """Recursively check if node contains input calls."""
-        if isinstance(node, IRCall):
-            if 'input' in node.function_name or 'scanner' in node.function_name:
-                return True
-        # Check children
-        if hasattr(node, 'body') and isinstance(node.body, list):
-            for child in node.body:
-                if self._contains_input_call(child):
-                    return True
-        if hasattr(node, 'value') and node.value:
-            if self._contains_input_call(node.value):
-                return True
-        return False
 
+    def _emit_braced(self, header: str, body: Optional[List[IRNode]]) -> None:
+        """Emit `header {`, the indented statements of body, and `}`."""
+        if not body:
+            self.emit_lines((header + " {", "}"))
+            return
+        visit, emit = self.visit, self.emit
+        emit(header + " {")
+        self.indent()
+        for statement in body:
+            code = visit(statement)
+            if code:
+                emit(code + ";")
+        self.dedent()
+        emit("}")
+    
     def visit_function(self, node: IRFunction) -> str:
         """Generate Java method."""
         # Access modifier
@@ -115,32 +167,20 @@ class JavaGenerator(BaseGenerator):
         else:
             java_return_type = self.map_type(return_type)
         
-        # Parameters - filter out 'self' for methods
-        params = []
-        for param_name, param_type in node.parameters:
-            # Skip 'self' parameter (Python methods)
-            if param_name == 'self':
-                continue
-            java_type = self.map_type(param_type) if isinstance(param_type, IRType) else 'Object'
-            params.append(f"{java_type} {param_name}")
-        params_str = ', '.join(params)
-        
-        # Method signature
+        # Parameters - skip 'self' (Python methods)
+        map_type = self.map_type
+        params_str = ', '.join([
+            f"{map_type(param_type)} {param_name}"
+            for param_name, param_type in node.parameters
+            if param_name != 'self'
+        ])
+        
+        # Method signature and body
         if node.is_method:
-            self.emit(f"{access} {java_return_type} {node.name}({params_str}) {{")
+            signature = f"{access} {java_return_type} {node.name}({params_str})"
         else:
-            self.emit(f"{access} static {java_return_type} {node.name}({params_str}) {{")
-        
-        # Method body
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-        self.dedent()
-        
-        self.emit("}")
+            signature = f"{access} static {java_return_type} {node.name}({params_str})"
+        self._emit_braced(signature, node.body)
         self.emit("")  # Blank line
         return ""
     
@@ -197,74 +237,29 @@ class JavaGenerator(BaseGenerator):
     
     def visit_if(self, node: IRIf) -> str:
         """Generate Java if statement."""
-        condition = self.visit(node.condition)
-        self.emit(f"if ({condition}) {{")
-        
-        self.indent()
-        if node.then_block:
-            for statement in node.then_block:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-        self.dedent()
-        self.emit("}")
+        visit, emit_braced = self.visit, self._emit_braced
+        emit_braced(f"if ({visit(node.condition)})", node.then_block)
         
         # elif blocks (else if in Java)
         for elif_cond, elif_body in node.elif_blocks:
-            elif_condition = self.visit(elif_cond)
-            self.emit(f"else if ({elif_condition}) {{")
-            self.indent()
-            if elif_body:
-                for statement in elif_body:
-                    code = self.visit(statement)
-                    if code and code.strip():
-                        self.emit(code + ";")
-            self.dedent()
-            self.emit("}")
+            emit_braced(f"else if ({visit(elif_cond)})", elif_body)
         
         # else block
         if node.else_block:
-            self.emit("else {")
-            self.indent()
-            for statement in node.else_block:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-            self.dedent()
-            self.emit("}")
+            emit_braced("else", node.else_block)
         
         return ""
     
     def visit_while(self, node: IRWhile) -> str:
         """Generate Java while loop."""
-        condition = self.visit(node.condition)
-        self.emit(f"while ({condition}) {{")
-        
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-        self.dedent()
-        self.emit("}")
-        
+        self._emit_braced(f"while ({self.visit(node.condition)})", node.body)
         return ""
     
     def visit_for(self, node: IRFor) -> str:
         """Generate Java for loop (enhanced for)."""
         iterable = self.visit(node.iterable)
-        self.emit(f"for (Object {node.variable} : {iterable}) {{")
-        
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code and code.strip():
-                    self.emit(code + ";")
-        self.dedent()
-        self.emit("}")
-        
+        element_type = self.map_type(node.element_type) if node.element_type else 'Object'
+        self._emit_braced(f"for ({element_type} {node.variable} : {iterable})", node.body)
         return ""
     
     def visit_return(self, node: IRReturn) -> str:
@@ -283,38 +278,19 @@ class JavaGenerator(BaseGenerator):
     
     def visit_call(self, node: IRCall) -> str:
         """Generate Java function call."""
-        # Handle array access hack
-        if node.function_name.endswith('[]'):
-            real_name = node.function_name[:-2]
-            if node.arguments:
-                index = self.visit(node.arguments[0])
-                return f"{real_name}[{index}]"
-            return f"{real_name}[]"
+        if node.function_name in ('input', 'read_input') or node.function_name.startswith('scanner.'):
+            self._uses_scanner = True
         
         # Handle method calls (object.method)
-        if '.' in node.function_name and not node.function_name.startswith('System.'):
+        if node.is_method_call and not node.function_name.startswith('System.'):
             # This is a method call: object.method(args)
-            args = ', '.join([self.visit(arg) for arg in node.arguments])
+            args = self._visit_args(node.arguments)
             return f"{node.function_name}({args})"
 
-        args = ', '.join([self.visit(arg) for arg in node.arguments])
+        args = self._visit_args(node.arguments)
         
         # Map common function names
-        func_map = {
-            'print': 'System.out.println',
-            'len': 'length',
-            'input': 'scanner.nextLine',
-            'read_input': 'scanner.nextLine',
-            'int': 'Integer.parseInt',
-            'stoi': 'Integer.parseInt',
-            'str': 'String.valueOf',
-            'to_string': 'String.valueOf',
-            'float': 'Double.parseDouble',
-            'stof': 'Double.parseDouble',
-            'size': 'length',
-            'length': 'length',
-        }
-        func_name = func_map.get(node.function_name, node.function_name)
+        func_name = _FUNC_MAP.get(node.function_name, node.function_name)
         
         # Special handling
         if node.function_name == 'len':
@@ -326,7 +302,7 @@ class JavaGenerator(BaseGenerator):
         
         # Check if this is a constructor call (class instantiation)
         # In Java, constructors start with uppercase letter
-        if node.function_name and node.function_name[0].isupper() and node.function_name not in func_map:
+        if node.function_name and node.function_name[0].isupper() and node.function_name not in _FUNC_MAP:
             # This is likely a constructor call
             return f"new {func_name}({args})"
         
@@ -335,67 +311,86 @@ class JavaGenerator(BaseGenerator):
     def visit_binary_op(self, node: IRBinaryOp) -> str:
         """Generate Java binary operation."""
         # Handle C++ stream output
-        if node.operator == '<<' and self.is_cout_stream(node):
-            args = self.collect_stream_args(node)
-            # Combine args with +
-            if not args:
-                return ""
-            
-            # Filter escaped newlines if they are separate args? 
-            # System.out.print(A + B);
-            # We must be careful about types. If A is string, + works.
-            
-            print_stmt = "System.out.print(" + " + ".join(args) + ")"
-            # If we know it ends with endl (\n), we could use println?
-            # But we replaced endl with "\n".
-            return print_stmt
+        if node.operator == '<<':
+            args = self.cout_stream_args(node)
+            if args is not None:
+                # Combine args with +
+                if not args:
+                    return ""
+                
+                # A trailing endl becomes println rather than + "\n"
+                method = "print"
+                if args[-1] == _ENDL:
+                    args.pop()
+                    method = "println"
+                
+                # System.out.print(A + B);
+                # + only concatenates once one side is a String, so start
+                # from "" unless the first argument is a string literal
+                if len(args) > 1 and not args[0].startswith('"'):
+                    args.insert(0, '""')
+                return f"System.out.{method}({' + '.join(args)})"
 
         left = self.visit(node.left)
         right = self.visit(node.right)
         
         # Map operators
-        op_map = {
-            'and': '&&',
-            'or': '||',
-            '//': '/',  # Integer division in Java
-        }
-        operator = op_map.get(node.operator, node.operator)
+        operator = _BINOP_MAP.get(node.operator, node.operator)
         
         return f"({left} {operator} {right})"
 
-    def is_cout_stream(self, node: IRNode) -> bool:
-        """Check if binary op is part of cout stream."""
-        if isinstance(node, IRIdentifier) and node.name == 'cout':
-            return True
-        if isinstance(node, IRBinaryOp) and node.operator == '<<':
-            return self.is_cout_stream(node.left)
-        return False
-
-    def collect_stream_args(self, node: IRNode) -> List[str]:
-        """Collect arguments from cout stream chain."""
-        if isinstance(node, IRBinaryOp) and node.operator == '<<':
-            return self.collect_stream_args(node.left) + self.collect_stream_args(node.right)
-        elif isinstance(node, IRIdentifier) and node.name == 'cout':
-            return []
-        elif isinstance(node, IRIdentifier) and node.name == 'endl':
-            return ['"\\n"']
-        else:
-            return [self.visit(node)]
+    def cout_stream_args(self, node: IRBinaryOp) -> Optional[List[str]]:
+        """
+        Collect the arguments of a `cout << a << b` chain in a single walk
+        down its left spine; return None if the chain does not start at cout.
+        """
+        operands = []
+        while isinstance(node, IRBinaryOp) and node.operator == '<<':
+            operands.append(node.right)
+            node = node.left
+        if not (isinstance(node, IRIdentifier) and node.name == 'cout'):
+            return None
+        
+        visit = self.visit
+        args = []
+        for operand in reversed(operands):
+            if isinstance(operand, IRIdentifier) and operand.name == 'endl':
+                args.append(_ENDL)
+            else:
+                args.append(visit(operand))
+        return args
+    
+    def visit_index_op(self, node: IRIndexOp) -> str:
+        """Generate Java array access."""
+        if node.index is None:
+            return f"{node.target}[]"
+        return f"{node.target}[{self.visit(node.index)}]"
     
     def visit_unary_op(self, node: IRUnaryOp) -> str:
         """Generate Java unary operation."""
         operand = self.visit(node.operand)
         
         # Map operators
-        op_map = {
-            'not': '!',
-        }
-        operator = op_map.get(node.operator, node.operator)
+        operator = _UNOP_MAP.get(node.operator, node.operator)
         
         return f"{operator}{operand}"
     
     def visit_literal(self, node: IRLiteral) -> str:
-        """Generate Java literal."""
+        """Generate Java literal, reusing the rendering of repeated values."""
+        value = node.value
+        # The value's type is part of the key so 1, 1.0 and True stay distinct
+        key = (node.literal_type, type(value), value)
+        try:
+            cached = self._lit_cache.get(key)
+        except TypeError:
+            # Unhashable value; render it without caching
+            return self._render_literal(node)
+        if cached is None:
+            cached = self._lit_cache[key] = self._render_literal(node)
+        return cached
+    
+    def _render_literal(self, node: IRLiteral) -> str:
+        """Render a Java literal."""
         if node.literal_type == IRType.STRING:
             # Escape quotes
             value = str(node.value).replace('"', '\\"')
@@ -415,14 +410,4 @@ class JavaGenerator(BaseGenerator):
 
     def map_type(self, ir_type: IRType) -> str:
         """Map IR type to Java type."""
-        type_map = {
-            IRType.INT: 'int',
-            IRType.FLOAT: 'double',
-            IRType.STRING: 'String',
-            IRType.BOOL: 'boolean',
-            IRType.VOID: 'void',
-            IRType.ARRAY: 'Object[]',
-            IRType.OBJECT: 'Object',
-            IRType.ANY: 'var'  # Use var for type inference (Java 10+)
-        }
-        return type_map.get(ir_type, 'var')
+        return _TYPE_MAP.get(ir_type, 'var')
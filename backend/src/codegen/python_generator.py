@@ -2,38 +2,100 @@
 Python Code Generator - Generates Python code from IR.
 """
 
-from typing import List
+from typing import List, Optional, TextIO
 from .base_generator import BaseGenerator
 from ..ir.ir_nodes import *
 
 
+# C++ and Java functions mapped to Python equivalents
+_FUNC_MAP = {
+    'stoi': 'int',
+    'to_string': 'str',
+    'read_input': 'input',
+    'size': 'len',
+    'length': 'len',
+    # Java mappings
+    'System.out.println': 'print',
+    'System.out.print': 'print',
+    'Integer.parseInt': 'int',
+    'Double.parseDouble': 'float',
+    'scanner.nextLine': 'input',
+    'scanner.nextInt': 'int(input())', # Approximation
+    'Math.max': 'max',
+    'Math.min': 'min',
+    'Math.abs': 'abs',
+    'Math.sqrt': 'math.sqrt',
+}
+
+# Binary operators
+_BINOP_MAP = {
+    '&&': 'and',
+    '||': 'or',
+}
+
+# Unary operators
+_UNOP_MAP = {
+    '!': 'not ',
+}
+
+# Literal renderers by type; other types print via str(), None as None
+_LITERAL_RENDERERS = {
+    IRType.STRING: lambda value: repr(str(value)),  # Escapes quotes, backslashes and control characters
+    IRType.BOOL: lambda value: 'True' if value else 'False',
+    IRType.VOID: lambda value: 'None',
+}
+
+
 class PythonGenerator(BaseGenerator):
     """Generates Python code from IR."""
     
-    def __init__(self):
-        super().__init__("python")
+    __slots__ = ('_has_main',)
+    
+    def __init__(self, out: Optional[TextIO] = None):
+        super().__init__("python", out)
+    
+    def _reset_output(self) -> None:
+        """Start a fresh output buffer and clear per-run state."""
+        super()._reset_output()
+        # Set by visit_function when a top-level main() is generated
+        self._has_main = False
     
     def generate_imports(self) -> None:
         """Generate Python imports."""
         # Add common imports if needed
         pass
     
+    def _emit_suite(self, header: str, body: Optional[List[IRNode]]) -> None:
+        """Emit a compound statement header and its indented body, or `pass` if empty."""
+        emit = self.emit
+        emit(header)
+        self.indent()
+        if body:
+            visit = self.visit
+            for statement in body:
+                code = visit(statement)
+                if code:
+                    emit(code)
+        else:
+            emit("pass")
+        self.dedent()
+    
     def visit_function(self, node: IRFunction) -> str:
         """Generate Python function."""
+        # Only a module-level main() can be called from the __main__ guard;
+        # methods and nested functions are emitted at a deeper indent
+        if node.name == 'main' and self.indent_level == 0:
+            self._has_main = True
+        
         # Function signature
-        params = ', '.join([name for name, _ in node.parameters])
-        self.emit(f"def {node.name}({params}):")
+        params = node.parameters
+        if len(params) == 1:
+            params = params[0][0]
+        else:
+            params = ', '.join([name for name, _ in params])
         
         # Function body
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code:
-                    self.emit(code)
-        else:
-            self.emit("pass")
-        self.dedent()
+        self._emit_suite(f"def {node.name}({params}):", node.body)
         
         self.emit("")  # Blank line after function
         return ""
@@ -48,16 +110,17 @@ class PythonGenerator(BaseGenerator):
             self.emit(f"class {node.name}:")
         
         self.indent()
+        visit = self.visit
         
         # Class fields
         if node.fields:
             for field in node.fields:
-                self.visit(field)
+                visit(field)
         
         # Class methods
         if node.methods:
             for method in node.methods:
-                self.visit(method)
+                visit(method)
         
         if not node.fields and not node.methods:
             self.emit("pass")
@@ -83,77 +146,28 @@ class PythonGenerator(BaseGenerator):
     
     def visit_if(self, node: IRIf) -> str:
         """Generate Python if statement."""
-        condition = self.visit(node.condition)
-        self.emit(f"if {condition}:")
-        
-        self.indent()
-        if node.then_block:
-            for statement in node.then_block:
-                code = self.visit(statement)
-                if code:
-                    self.emit(code)
-        else:
-            self.emit("pass")
-        self.dedent()
+        visit, emit_suite = self.visit, self._emit_suite
+        emit_suite(f"if {visit(node.condition)}:", node.then_block)
         
         # elif blocks
         for elif_cond, elif_body in node.elif_blocks:
-            elif_condition = self.visit(elif_cond)
-            self.emit(f"elif {elif_condition}:")
-            self.indent()
-            if elif_body:
-                for statement in elif_body:
-                    code = self.visit(statement)
-                    if code:
-                        self.emit(code)
-            else:
-                self.emit("pass")
-            self.dedent()
+            emit_suite(f"elif {visit(elif_cond)}:", elif_body)
         
         # else block
         if node.else_block:
-            self.emit("else:")
-            self.indent()
-            for statement in node.else_block:
-                code = self.visit(statement)
-                if code:
-                    self.emit(code)
-            self.dedent()
+            emit_suite("else:", node.else_block)
         
         return ""
     
     def visit_while(self, node: IRWhile) -> str:
         """Generate Python while loop."""
-        condition = self.visit(node.condition)
-        self.emit(f"while {condition}:")
-        
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code:
-                    self.emit(code)
-        else:
-            self.emit("pass")
-        self.dedent()
-        
+        self._emit_suite(f"while {self.visit(node.condition)}:", node.body)
         return ""
     
     def visit_for(self, node: IRFor) -> str:
         """Generate Python for loop."""
         iterable = self.visit(node.iterable)
-        self.emit(f"for {node.variable} in {iterable}:")
-        
-        self.indent()
-        if node.body:
-            for statement in node.body:
-                code = self.visit(statement)
-                if code:
-                    self.emit(code)
-        else:
-            self.emit("pass")
-        self.dedent()
-        
+        self._emit_suite(f"for {node.variable} in {iterable}:", node.body)
         return ""
     
     def visit_return(self, node: IRReturn) -> str:
@@ -166,14 +180,12 @@ class PythonGenerator(BaseGenerator):
         return ""
 
     def generate(self, ir_program: IRProgram) -> str:
-        code = super().generate(ir_program)
+        super().generate(ir_program)
         
-        # Check if main exists
-        has_main = any(f.name == 'main' for f in ir_program.functions)
-        if has_main:
-            code += '\n\nif __name__ == "__main__":\n    main()'
+        if self._has_main:
+            self._buf.write('\n\nif __name__ == "__main__":\n    main()')
             
-        return code
+        return self._result()
 
     def visit_break(self, node: IRBreak) -> str:
         """Generate Python break."""
@@ -182,30 +194,9 @@ class PythonGenerator(BaseGenerator):
 
     def visit_call(self, node: IRCall) -> str:
         """Generate Python function call."""
-        args_list = [self.visit(arg) for arg in node.arguments]
-        args = ', '.join(args_list)
+        args = self._visit_args(node.arguments)
         
-        # Mapping C++ and Java functions to Python
-        func_map = {
-            'stoi': 'int',
-            'to_string': 'str',
-            'read_input': 'input',
-            'size': 'len',
-            'length': 'len',
-            # Java mappings
-            'System.out.println': 'print',
-            'System.out.print': 'print',
-            'Integer.parseInt': 'int',
-            'Double.parseDouble': 'float',
-            'scanner.nextLine': 'input',
-            'scanner.nextInt': 'int(input())', # Approximation
-            'Math.max': 'max',
-            'Math.min': 'min',
-            'Math.abs': 'abs',
-            'Math.sqrt': 'math.sqrt',
-        }
-        
-        func_name = func_map.get(node.function_name, node.function_name)
+        func_name = _FUNC_MAP.get(node.function_name, node.function_name)
         
         # Special handling for print end argument
         if node.function_name == 'System.out.print':
@@ -216,20 +207,15 @@ class PythonGenerator(BaseGenerator):
     def visit_binary_op(self, node: IRBinaryOp) -> str:
         """Generate Python binary operation."""
         # Handle C++ stream output
-        if node.operator == '<<' and self.is_cout_stream(node):
-            args = self.collect_stream_args(node)
-            args_str = ", ".join(args)
-            return f"print({args_str}, sep='', end='')"
+        if node.operator == '<<':
+            args = self.cout_stream_args(node)
+            if args is not None:
+                return f"print({', '.join(args)}, sep='', end='')"
 
         left = self.visit(node.left)
         right = self.visit(node.right)
         
-        # Map operators
-        op_map = {
-            '&&': 'and',
-            '||': 'or',
-        }
-        operator = op_map.get(node.operator, node.operator)
+        operator = _BINOP_MAP.get(node.operator, node.operator)
         
         # Remove redundant parens for simple string concat to avoid artifacts
         if operator == '+':
@@ -239,49 +225,47 @@ class PythonGenerator(BaseGenerator):
 
         return f"({left} {operator} {right})"
     
-    def is_cout_stream(self, node: IRNode) -> bool:
-        """Check if binary op is part of cout stream."""
-        if isinstance(node, IRIdentifier) and node.name == 'cout':
-            return True
-        if isinstance(node, IRBinaryOp) and node.operator == '<<':
-            return self.is_cout_stream(node.left)
-        return False
-
-    def collect_stream_args(self, node: IRNode) -> List[str]:
-        """Collect arguments from cout stream chain."""
-        if isinstance(node, IRBinaryOp) and node.operator == '<<':
-            return self.collect_stream_args(node.left) + self.collect_stream_args(node.right)
-        elif isinstance(node, IRIdentifier) and node.name == 'cout':
-            return []
-        elif isinstance(node, IRIdentifier) and node.name == 'endl':
-            return ["'\\n'"]
-        else:
-            return [self.visit(node)]
-
+    def cout_stream_args(self, node: IRBinaryOp) -> Optional[List[str]]:
+        """
+        Collect the arguments of a `cout << a << b` chain in a single walk
+        down its left spine; return None if the chain does not start at cout.
+        """
+        operands = []
+        while isinstance(node, IRBinaryOp) and node.operator == '<<':
+            operands.append(node.right)
+            node = node.left
+        if not (isinstance(node, IRIdentifier) and node.name == 'cout'):
+            return None
+        
+        visit = self.visit
+        args = []
+        for operand in reversed(operands):
+            if isinstance(operand, IRIdentifier) and operand.name == 'endl':
+                args.append("'\\n'")
+            else:
+                args.append(visit(operand))
+        return args
+    
+    def visit_index_op(self, node: IRIndexOp) -> str:
+        """Generate Python subscript."""
+        if node.index is None:
+            return f"{node.target}[]"
+        return f"{node.target}[{self.visit(node.index)}]"
+    
     def visit_unary_op(self, node: IRUnaryOp) -> str:
         """Generate Python unary operation."""
         operand = self.visit(node.operand)
         
-        # Map operators
-        op_map = {
-            '!': 'not ',
-        }
-        operator = op_map.get(node.operator, node.operator)
+        operator = _UNOP_MAP.get(node.operator, node.operator)
         
         return f"{operator}{operand}"
     
     def visit_literal(self, node: IRLiteral) -> str:
         """Generate Python literal."""
-        if node.literal_type == IRType.STRING:
-            # Escape quotes
-            value = str(node.value).replace("'", "\\'")
-            return f"'{value}'"
-        elif node.literal_type == IRType.BOOL:
-            return 'True' if node.value else 'False'
-        elif node.literal_type == IRType.VOID or node.value is None:
-            return 'None'
-        else:
-            return str(node.value)
+        render = _LITERAL_RENDERERS.get(node.literal_type)
+        if render is not None:
+            return render(node.value)
+        return 'None' if node.value is None else str(node.value)
     
     def visit_identifier(self, node: IRIdentifier) -> str:
         """Generate Python identifier."""
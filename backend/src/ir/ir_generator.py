@@ -2,17 +2,53 @@
 IR Generator - Converts AST to Intermediate Representation.
 """
 
-from typing import Optional, List
+import sys
+from typing import Dict, List, Optional, Set
 from ..parser.ast_nodes import *
 from .ir_nodes import *
 
 
+# Lowercased source type name -> IR type
+_TYPE_MAP = {
+    # Integer types
+    'int': IRType.INT,
+    'integer': IRType.INT,
+    'long': IRType.INT,
+    'short': IRType.INT,
+    'byte': IRType.INT,
+    # Float types
+    'float': IRType.FLOAT,
+    'double': IRType.FLOAT,
+    # String types
+    'str': IRType.STRING,
+    'string': IRType.STRING,
+    # Boolean types
+    'bool': IRType.BOOL,
+    'boolean': IRType.BOOL,
+    # Void
+    'void': IRType.VOID,
+    'none': IRType.VOID,
+}
+
+# Literal type name -> IR type
+_LITERAL_TYPE_MAP = {
+    'int': IRType.INT,
+    'float': IRType.FLOAT,
+    'string': IRType.STRING,
+    'str': IRType.STRING,
+    'bool': IRType.BOOL,
+    'boolean': IRType.BOOL,
+    'null': IRType.VOID,
+    'None': IRType.VOID
+}
+
+
 class IRGenerator:
     """
     Generates language-agnostic IR from AST.
     """
     
-    def __init__(self, source_language: str = "python"):
+    def __init__(self, source_language: str = "python") -> None:
         """
         Initialize IR generator.
         
@@ -21,22 +57,53 @@ class IRGenerator:
         """
         self.source_language = source_language.lower()
         self.ir_program = IRProgram()
-        self.scopes = [set()]  # Stack of defined variables
+        self.scopes: List[Set[str]] = [set()]  # Stack of names defined in each scope
+        self._defined: Dict[str, int] = {}  # name -> number of open scopes defining it
+        
+        self._dispatch = self._visitor_table()
+    
+    @classmethod
+    def _visitor_table(cls) -> dict:
+        """
+        Get the ASTNodeType -> visit_* function table for this class.
+        Built on first use and shared by every instance of the class.
+        """
+        table = cls.__dict__.get('_visitors')
+        if table is None:
+            table = {}
+            for node_type in ASTNodeType:
+                visitor = getattr(cls, f"visit_{node_type.value.lower()}", None)
+                if visitor is not None:
+                    table[node_type] = visitor
+            cls._visitors = table
+        return table
+    
+    def reset(self) -> None:
+        """Clear state from a previous run so the generator can be reused."""
+        self.ir_program = IRProgram()
+        self.scopes = [set()]
+        self._defined = {}
     
-    def enter_scope(self):
+    def enter_scope(self) -> None:
         self.scopes.append(set())
         
-    def exit_scope(self):
-        self.scopes.pop()
-        
-    def define_var(self, name: str):
-        self.scopes[-1].add(name)
+    def exit_scope(self) -> None:
+        defined = self._defined
+        for name in self.scopes.pop():
+            count = defined[name] - 1
+            if count:
+                defined[name] = count
+            else:
+                del defined[name]
+        
+    def define_var(self, name: str) -> None:
+        scope = self.scopes[-1]
+        if name not in scope:
+            scope.add(name)
+            self._defined[name] = self._defined.get(name, 0) + 1
         
     def is_defined(self, name: str) -> bool:
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return True
-        return False
+        return name in self._defined
         
     # ... (generate method unchanged)
 
@@ -52,7 +119,7 @@ class IRGenerator:
         ir_params = []
         for param_name, param_type in node.parameters:
             ir_param_type = self.map_type(param_type) if param_type else IRType.ANY
-            ir_params.append((param_name, ir_param_type))
+            ir_params.append((sys.intern(param_name), ir_param_type))
             self.define_var(param_name)
         
         # Convert body
@@ -64,11 +131,7 @@ class IRGenerator:
         
         self.exit_scope()
         
-        ir_func = IRFunction(node.name, ir_params, return_type, ir_body)
-        ir_func.metadata['source_line'] = node.line
-        ir_func.metadata['source_column'] = node.column
-        
-        return ir_func
+        return self._with_source(IRFunction(sys.intern(node.name), ir_params, return_type, ir_body), node)
 
     # ... (visit_classdef - technically class creates scope too, but let's stick to functions first)
     
@@ -81,16 +144,10 @@ class IRGenerator:
                 self.define_var(node.target)
                 # It's a new variable definition
                 # We inferred type as ANY (auto)
-                ir_var = IRVariable(node.target, IRType.ANY, value)
-                ir_var.metadata['source_line'] = node.line
-                ir_var.metadata['source_column'] = node.column
-                return ir_var
-        
-        ir_assign = IRAssignment(node.target, value, node.operator)
-        ir_assign.metadata['source_line'] = node.line
-        ir_assign.metadata['source_column'] = node.column
+                return self._with_source(IRVariable(sys.intern(node.target), IRType.ANY, value), node)
         
-        return ir_assign
+        ir_assign = IRAssignment(sys.intern(node.target), value, sys.intern(node.operator))
+        return self._with_source(ir_assign, node)
     
     def generate(self, ast: Program) -> IRProgram:
         """
@@ -134,9 +191,11 @@ class IRGenerator:
         if node is None:
             return None
         
-        method_name = f"visit_{node.node_type.value.lower()}"
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        try:
+            visitor = self._dispatch[node.node_type]
+        except KeyError:
+            return self.generic_visit(node)
+        return visitor(self, node)
     
     def generic_visit(self, node: ASTNode) -> Optional[IRNode]:
         """Generic visitor for unknown node types."""
@@ -161,11 +220,8 @@ class IRGenerator:
             if isinstance(ir_field, IRVariable):
                 ir_fields.append(ir_field)
         
-        ir_class = IRClass(node.name, ir_methods, ir_fields, node.base_classes)
-        ir_class.metadata['source_line'] = node.line
-        ir_class.metadata['source_column'] = node.column
-        
-        return ir_class
+        base_classes = [sys.intern(base) for base in node.base_classes]
+        return self._with_source(IRClass(sys.intern(node.name), ir_methods, ir_fields, base_classes), node)
     
     def visit_variabledecl(self, node: VariableDecl) -> IRVariable:
         """Convert VariableDecl to IRVariable."""
@@ -175,62 +231,57 @@ class IRGenerator:
         if node.initial_value:
             initial_value = self.visit(node.initial_value)
         
-        ir_var = IRVariable(node.name, var_type, initial_value)
-        ir_var.metadata['source_line'] = node.line
-        ir_var.metadata['source_column'] = node.column
-        
-        return ir_var
+        return self._with_source(IRVariable(sys.intern(node.name), var_type, initial_value), node)
     
 
     
+    def _with_source(self, ir_node: IRNode, node: ASTNode) -> IRNode:
+        """Copy the source position of an AST node onto the IR node built from it."""
+        ir_node.source_line = node.line
+        ir_node.source_column = node.column
+        return ir_node
+    
+    def _visit_block(self, stmts: List[ASTNode]) -> List[IRNode]:
+        """Visit a statement list, dropping statements that produce no IR."""
+        visit = self.visit
+        return [ir for ir in map(visit, stmts) if ir is not None]
+    
     def visit_ifstatement(self, node: IfStatement) -> IRIf:
         """Convert IfStatement to IRIf."""
         condition = self.visit(node.condition)
         
-        then_block = [self.visit(stmt) for stmt in node.then_block]
-        then_block = [stmt for stmt in then_block if stmt is not None]
+        then_block = self._visit_block(node.then_block)
         
         elif_blocks = []
         for elif_cond, elif_body in node.elif_blocks:
             ir_elif_cond = self.visit(elif_cond)
-            ir_elif_body = [self.visit(stmt) for stmt in elif_body]
-            ir_elif_body = [stmt for stmt in ir_elif_body if stmt is not None]
+            ir_elif_body = self._visit_block(elif_body)
             elif_blocks.append((ir_elif_cond, ir_elif_body))
         
-        else_block = [self.visit(stmt) for stmt in node.else_block]
-        else_block = [stmt for stmt in else_block if stmt is not None]
+        else_block = self._visit_block(node.else_block)
         
-        ir_if = IRIf(condition, then_block, elif_blocks, else_block)
-        ir_if.metadata['source_line'] = node.line
-        ir_if.metadata['source_column'] = node.column
-        
-        return ir_if
+        return self._with_source(IRIf(condition, then_block, elif_blocks, else_block), node)
     
     def visit_whileloop(self, node: WhileLoop) -> IRWhile:
         """Convert WhileLoop to IRWhile."""
         condition = self.visit(node.condition)
         
-        body = [self.visit(stmt) for stmt in node.body]
-        body = [stmt for stmt in body if stmt is not None]
-        
-        ir_while = IRWhile(condition, body)
-        ir_while.metadata['source_line'] = node.line
-        ir_while.metadata['source_column'] = node.column
+        body = self._visit_block(node.body)
         
-        return ir_while
+        return self._with_source(IRWhile(condition, body), node)
     
     def visit_forloop(self, node: ForLoop) -> IRFor:
         """Convert ForLoop to IRFor."""
         iterable = self.visit(node.iterable)
         
-        body = [self.visit(stmt) for stmt in node.body]
-        body = [stmt for stmt in body if stmt is not None]
+        body = self._visit_block(node.body)
         
-        ir_for = IRFor(node.variable, iterable, body)
-        ir_for.metadata['source_line'] = node.line
-        ir_for.metadata['source_column'] = node.column
+        # range() yields ints; other iterables have no known element type
+        element_type = None
+        if isinstance(iterable, IRCall) and iterable.function_name == 'range':
+            element_type = IRType.INT
         
-        return ir_for
+        return self._with_source(IRFor(sys.intern(node.variable), iterable, body, element_type), node)
     
     def visit_return(self, node: Return) -> IRReturn:
         """Convert Return to IRReturn."""
@@ -238,11 +289,7 @@ class IRGenerator:
         if node.expression:
             value = self.visit(node.expression)
         
-        ir_return = IRReturn(value)
-        ir_return.metadata['source_line'] = node.line
-        ir_return.metadata['source_column'] = node.column
-        
-        return ir_return
+        return self._with_source(IRReturn(value), node)
     
     def visit_binaryop(self, node: BinaryOp) -> IRBinaryOp:
         """Convert BinaryOp to IRBinaryOp."""
@@ -252,11 +299,7 @@ class IRGenerator:
         # Infer result type
         result_type = self.infer_binary_op_type(node.operator, left, right)
         
-        ir_binop = IRBinaryOp(left, node.operator, right, result_type)
-        ir_binop.metadata['source_line'] = node.line
-        ir_binop.metadata['source_column'] = node.column
-        
-        return ir_binop
+        return self._with_source(IRBinaryOp(left, sys.intern(node.operator), right, result_type), node)
     
     def visit_unaryop(self, node: UnaryOp) -> IRUnaryOp:
         """Convert UnaryOp to IRUnaryOp."""
@@ -265,51 +308,36 @@ class IRGenerator:
         # Infer result type
         result_type = operand.ir_type if operand else IRType.ANY
         
-        ir_unop = IRUnaryOp(node.operator, operand, result_type)
-        ir_unop.metadata['source_line'] = node.line
-        ir_unop.metadata['source_column'] = node.column
-        
-        return ir_unop
+        return self._with_source(IRUnaryOp(sys.intern(node.operator), operand, result_type), node)
     
-    def visit_functioncall(self, node: FunctionCall) -> IRCall:
-        """Convert FunctionCall to IRCall."""
+    def visit_functioncall(self, node: FunctionCall) -> IRNode:
+        """Convert FunctionCall to IRCall, or IRIndexOp for array access."""
         arguments = [self.visit(arg) for arg in node.arguments]
         arguments = [arg for arg in arguments if arg is not None]
         
-        ir_call = IRCall(node.function_name, arguments)
-        ir_call.metadata['source_line'] = node.line
-        ir_call.metadata['source_column'] = node.column
+        # The parsers encode arr[i] as a call to "arr[]"
+        if node.function_name.endswith('[]'):
+            ir_index = IRIndexOp(sys.intern(node.function_name[:-2]),
+                                 arguments[0] if arguments else None)
+            return self._with_source(ir_index, node)
         
-        return ir_call
+        return self._with_source(IRCall(sys.intern(node.function_name), arguments), node)
     
     def visit_identifier(self, node: Identifier) -> IRIdentifier:
         """Convert Identifier to IRIdentifier."""
-        ir_id = IRIdentifier(node.name)
-        ir_id.metadata['source_line'] = node.line
-        ir_id.metadata['source_column'] = node.column
-        
-        return ir_id
+        return self._with_source(IRIdentifier(sys.intern(node.name)), node)
     
     def visit_literal(self, node: Literal) -> IRLiteral:
         """Convert Literal to IRLiteral."""
         literal_type = self.map_literal_type(node.literal_type)
         
-        ir_lit = IRLiteral(node.value, literal_type)
-        ir_lit.metadata['source_line'] = node.line
-        ir_lit.metadata['source_column'] = node.column
-        
-        return ir_lit
+        return self._with_source(IRLiteral(node.value, literal_type), node)
     
     def visit_block(self, node: Block) -> IRBlock:
         """Convert Block to IRBlock."""
-        statements = [self.visit(stmt) for stmt in node.statements]
-        statements = [stmt for stmt in statements if stmt is not None]
-        
-        ir_block = IRBlock(statements)
-        ir_block.metadata['source_line'] = node.line
-        ir_block.metadata['source_column'] = node.column
+        statements = self._visit_block(node.statements)
         
-        return ir_block
+        return self._with_source(IRBlock(statements), node)
     
     def visit_expressionstatement(self, node: ExpressionStatement) -> Optional[IRNode]:
         """Convert ExpressionStatement."""
@@ -317,10 +345,7 @@ class IRGenerator:
     
     def visit_break(self, node: Break) -> IRBreak:
         """Convert Break to IRBreak."""
-        ir_break = IRBreak()
-        ir_break.metadata['source_line'] = node.line
-        ir_break.metadata['source_column'] = node.column
-        return ir_break
+        return self._with_source(IRBreak(), node)
     
     def map_type(self, type_str: Optional[str]) -> IRType:
         """
@@ -336,26 +361,9 @@ class IRGenerator:
             return IRType.ANY
         
         type_str = type_str.lower()
-        
-        # Integer types
-        if type_str in ['int', 'integer', 'long', 'short', 'byte']:
-            return IRType.INT
-        
-        # Float types
-        if type_str in ['float', 'double']:
-            return IRType.FLOAT
-        
-        # String types
-        if type_str in ['str', 'string']:
-            return IRType.STRING
-        
-        # Boolean types
-        if type_str in ['bool', 'boolean']:
-            return IRType.BOOL
-        
-        # Void
-        if type_str in ['void', 'none']:
-            return IRType.VOID
+        ir_type = _TYPE_MAP.get(type_str)
+        if ir_type is not None:
+            return ir_type
         
         # Array/List
         if 'list' in type_str or 'array' in type_str or '[]' in type_str:
@@ -366,17 +374,7 @@ class IRGenerator:
     
     def map_literal_type(self, literal_type: str) -> IRType:
         """Map literal type string to IRType."""
-        type_map = {
-            'int': IRType.INT,
-            'float': IRType.FLOAT,
-            'string': IRType.STRING,
-            'str': IRType.STRING,
-            'bool': IRType.BOOL,
-            'boolean': IRType.BOOL,
-            'null': IRType.VOID,
-            'None': IRType.VOID
-        }
-        return type_map.get(literal_type, IRType.ANY)
+        return _LITERAL_TYPE_MAP.get(literal_type, IRType.ANY)
     
     def infer_binary_op_type(self, operator: str, left: IRNode, right: IRNode) -> IRType:
         """Infer result type of binary operation."""
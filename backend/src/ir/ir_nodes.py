@@ -3,13 +3,17 @@ Intermediate Representation (IR) Node Definitions.
 Language-agnostic IR for code translation.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Any, Dict
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import List, Optional, Any, Callable, Dict, Union, get_args, get_origin, get_type_hints
 from enum import Enum
 
 
 class IRNodeType(Enum):
     """Types of IR nodes."""
+    # Members compare by identity, so hash by identity too; Enum's own
+    # __hash__ is Python-level and slows every node-type-keyed dict lookup
+    __hash__ = object.__hash__
+    
     PROGRAM = "program"
     FUNCTION = "function"
     CLASS = "class"
@@ -20,6 +24,7 @@ class IRNodeType(Enum):
     FOR = "for"
     RETURN = "return"
     CALL = "call"
+    INDEX_OP = "index_op"
     BINARY_OP = "binary_op"
     UNARY_OP = "unary_op"
     LITERAL = "literal"
@@ -34,6 +39,8 @@ class IRNodeType(Enum):
 
 class IRType(Enum):
     """IR type system."""
+    __hash__ = object.__hash__  # See IRNodeType
+    
     INT = "int"
     FLOAT = "float"
     STRING = "string"
@@ -47,37 +54,109 @@ class IRType(Enum):
 @dataclass
 class IRNode:
     """Base class for all IR nodes."""
+    # Slots instead of a per-instance __dict__, declared by hand as on Token since
+    # dataclass(slots=True) needs Python 3.10. Slotted fields cannot have class-level
+    # defaults, so every node class sets all of its fields in __init__.
+    __slots__ = ('node_type', 'ir_type', 'source_line', 'source_column')
+    
     node_type: IRNodeType
-    ir_type: Optional[IRType] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    ir_type: Optional[IRType]
+    source_line: Optional[int]
+    source_column: Optional[int]
+    
+    def __init__(self, node_type: IRNodeType, ir_type: Optional[IRType] = None,
+                 source_line: Optional[int] = None, source_column: Optional[int] = None):
+        self.node_type = node_type
+        self.ir_type = ir_type
+        self.source_line = source_line
+        self.source_column = source_column
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Source position of the node, as a dict of the attributes that are set."""
+        metadata = {}
+        if self.source_line is not None:
+            metadata['source_line'] = self.source_line
+        if self.source_column is not None:
+            metadata['source_column'] = self.source_column
+        return metadata
     
     def to_dict(self) -> dict:
         """Convert IR node to dictionary."""
-        result = {
-            'node_type': self.node_type.value,
-            'ir_type': self.ir_type.value if self.ir_type else None
-        }
-        for key, value in self.__dict__.items():
-            if key in ['node_type', 'ir_type', 'metadata']:
-                continue
-            if isinstance(value, list):
-                result[key] = [v.to_dict() if isinstance(v, IRNode) else v for v in value]
-            elif isinstance(value, IRNode):
-                result[key] = value.to_dict()
+        cls = type(self)
+        # Generated on first use and shared by every instance of the class
+        to_dict = cls.__dict__.get('_to_dict')
+        if to_dict is None:
+            to_dict = _compile_to_dict(cls)
+            cls._to_dict = to_dict
+        return to_dict(self)
+
+
+# Fields every node serializes itself rather than by name
+_BASE_FIELDS = frozenset(('node_type', 'ir_type', 'source_line', 'source_column'))
+
+
+def _is_node_hint(hint: Any) -> bool:
+    """Whether a field annotation names an IR node class, possibly Optional."""
+    if get_origin(hint) is Union:
+        return any(_is_node_hint(arg) for arg in get_args(hint) if arg is not type(None))
+    return isinstance(hint, type) and issubclass(hint, IRNode)
+
+
+def _compile_to_dict(cls: type) -> Callable[[IRNode], dict]:
+    """
+    Generate a to_dict function for an IR node class from its dataclass fields.
+    
+    Each field is converted according to its annotation: nodes and lists of nodes
+    are serialized recursively, other lists are copied, and anything else is
+    stored as is.
+    """
+    hints = get_type_hints(cls)
+    items = [
+        # _value_ is a plain member attribute; .value goes through a property
+        "'node_type': self.node_type._value_",
+        "'ir_type': self.ir_type._value_ if self.ir_type else None",
+    ]
+    for f in dataclass_fields(cls):
+        name = f.name
+        if name in _BASE_FIELDS:
+            continue
+        hint = hints[name]
+        attr = f"self.{name}"
+        if _is_node_hint(hint):
+            expr = f"{attr}.to_dict() if {attr} is not None else None"
+        elif get_origin(hint) is list:
+            args = get_args(hint)
+            if args and _is_node_hint(args[0]):
+                expr = f"[v.to_dict() for v in {attr}]"
             else:
-                result[key] = value
-        if self.metadata:
-            result['metadata'] = self.metadata
-        return result
+                expr = f"list({attr})"
+        else:
+            expr = attr
+        items.append(f"{name!r}: {expr}")
+    
+    source = (
+        "def to_dict(self):\n"
+        f"    result = {{{', '.join(items)}}}\n"
+        "    metadata = self.metadata\n"
+        "    if metadata:\n"
+        "        result['metadata'] = metadata\n"
+        "    return result\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace['to_dict']
 
 
 @dataclass
 class IRProgram(IRNode):
     """IR Program node."""
-    functions: List['IRFunction'] = field(default_factory=list)
-    classes: List['IRClass'] = field(default_factory=list)
-    globals: List['IRVariable'] = field(default_factory=list)
-    main_body: List[IRNode] = field(default_factory=list)  # Top-level statements
+    __slots__ = ('functions', 'classes', 'globals', 'main_body')
+    
+    functions: List['IRFunction']
+    classes: List['IRClass']
+    globals: List['IRVariable']
+    main_body: List[IRNode]  # Top-level statements
     
     def __init__(self):
         super().__init__(IRNodeType.PROGRAM)
@@ -90,12 +169,14 @@ class IRProgram(IRNode):
 @dataclass
 class IRFunction(IRNode):
     """IR Function node."""
-    name: str = ""
-    parameters: List[tuple] = field(default_factory=list)  # [(name, type), ...]
-    return_type: IRType = IRType.VOID
-    body: List[IRNode] = field(default_factory=list)
-    is_method: bool = False
-    access_modifier: Optional[str] = None  # public, private, protected
+    __slots__ = ('name', 'parameters', 'return_type', 'body', 'is_method', 'access_modifier')
+    
+    name: str
+    parameters: List[tuple]  # [(name, IRType), ...]
+    return_type: IRType
+    body: List[IRNode]
+    is_method: bool
+    access_modifier: Optional[str]  # public, private, protected
     
     def __init__(self, name: str, parameters: List[tuple] = None, 
                  return_type: IRType = IRType.VOID, body: List[IRNode] = None):
@@ -111,10 +192,12 @@ class IRFunction(IRNode):
 @dataclass
 class IRClass(IRNode):
     """IR Class node."""
-    name: str = ""
-    methods: List[IRFunction] = field(default_factory=list)
-    fields: List['IRVariable'] = field(default_factory=list)
-    base_classes: List[str] = field(default_factory=list)
+    __slots__ = ('name', 'methods', 'fields', 'base_classes')
+    
+    name: str
+    methods: List[IRFunction]
+    fields: List['IRVariable']
+    base_classes: List[str]
     
     def __init__(self, name: str, methods: List[IRFunction] = None,
                  fields: List['IRVariable'] = None, base_classes: List[str] = None):
@@ -128,10 +211,12 @@ class IRClass(IRNode):
 @dataclass
 class IRVariable(IRNode):
     """IR Variable declaration node."""
-    name: str = ""
-    var_type: IRType = IRType.ANY
-    initial_value: Optional[IRNode] = None
-    is_const: bool = False
+    __slots__ = ('name', 'var_type', 'initial_value', 'is_const')
+    
+    name: str
+    var_type: IRType
+    initial_value: Optional[IRNode]
+    is_const: bool
     
     def __init__(self, name: str, var_type: IRType = IRType.ANY,
                  initial_value: Optional[IRNode] = None):
@@ -145,9 +230,11 @@ class IRVariable(IRNode):
 @dataclass
 class IRAssignment(IRNode):
     """IR Assignment node."""
-    target: str = ""
-    value: Optional[IRNode] = None
-    operator: str = "="  # =, +=, -=, etc.
+    __slots__ = ('target', 'value', 'operator')
+    
+    target: str
+    value: Optional[IRNode]
+    operator: str  # =, +=, -=, etc.
     
     def __init__(self, target: str, value: IRNode, operator: str = "="):
         super().__init__(IRNodeType.ASSIGNMENT)
@@ -159,10 +246,12 @@ class IRAssignment(IRNode):
 @dataclass
 class IRIf(IRNode):
     """IR If statement node."""
-    condition: Optional[IRNode] = None
-    then_block: List[IRNode] = field(default_factory=list)
-    elif_blocks: List[tuple] = field(default_factory=list)  # [(condition, block), ...]
-    else_block: List[IRNode] = field(default_factory=list)
+    __slots__ = ('condition', 'then_block', 'elif_blocks', 'else_block')
+    
+    condition: Optional[IRNode]
+    then_block: List[IRNode]
+    elif_blocks: List[tuple]  # [(condition, block), ...]
+    else_block: List[IRNode]
     
     def __init__(self, condition: IRNode, then_block: List[IRNode] = None,
                  elif_blocks: List[tuple] = None, else_block: List[IRNode] = None):
@@ -176,8 +265,10 @@ class IRIf(IRNode):
 @dataclass
 class IRWhile(IRNode):
     """IR While loop node."""
-    condition: Optional[IRNode] = None
-    body: List[IRNode] = field(default_factory=list)
+    __slots__ = ('condition', 'body')
+    
+    condition: Optional[IRNode]
+    body: List[IRNode]
     
     def __init__(self, condition: IRNode, body: List[IRNode] = None):
         super().__init__(IRNodeType.WHILE)
@@ -188,21 +279,28 @@ class IRWhile(IRNode):
 @dataclass
 class IRFor(IRNode):
     """IR For loop node."""
-    variable: str = ""
-    iterable: Optional[IRNode] = None
-    body: List[IRNode] = field(default_factory=list)
+    __slots__ = ('variable', 'iterable', 'body', 'element_type')
+    
+    variable: str
+    iterable: Optional[IRNode]
+    body: List[IRNode]
+    element_type: Optional[IRType]  # Type of the loop variable, if known
     
-    def __init__(self, variable: str, iterable: IRNode, body: List[IRNode] = None):
+    def __init__(self, variable: str, iterable: IRNode, body: List[IRNode] = None,
+                 element_type: Optional[IRType] = None):
         super().__init__(IRNodeType.FOR)
         self.variable = variable
         self.iterable = iterable
         self.body = body or []
+        self.element_type = element_type
 
 
 @dataclass
 class IRReturn(IRNode):
     """IR Return statement node."""
-    value: Optional[IRNode] = None
+    __slots__ = ('value',)
+    
+    value: Optional[IRNode]
     
     def __init__(self, value: Optional[IRNode] = None):
         super().__init__(IRNodeType.RETURN)
@@ -212,22 +310,43 @@ class IRReturn(IRNode):
 @dataclass
 class IRCall(IRNode):
     """IR Function call node."""
-    function_name: str = ""
-    arguments: List[IRNode] = field(default_factory=list)
+    __slots__ = ('function_name', 'arguments', 'is_method_call')
+    
+    function_name: str
+    arguments: List[IRNode]
+    is_method_call: bool  # dotted name such as "obj.method"
     
     def __init__(self, function_name: str, arguments: List[IRNode] = None,
                  return_type: IRType = IRType.ANY):
         super().__init__(IRNodeType.CALL, return_type)
         self.function_name = function_name
         self.arguments = arguments or []
+        self.is_method_call = '.' in function_name
+
+
+@dataclass
+class IRIndexOp(IRNode):
+    """IR Index (subscript) node, e.g. arr[i]."""
+    __slots__ = ('target', 'index')
+    
+    target: str
+    index: Optional[IRNode]
+    
+    def __init__(self, target: str, index: Optional[IRNode] = None,
+                 result_type: IRType = IRType.ANY):
+        super().__init__(IRNodeType.INDEX_OP, result_type)
+        self.target = target
+        self.index = index
 
 
 @dataclass
 class IRBinaryOp(IRNode):
     """IR Binary operation node."""
-    left: Optional[IRNode] = None
-    operator: str = ""
-    right: Optional[IRNode] = None
+    __slots__ = ('left', 'operator', 'right')
+    
+    left: Optional[IRNode]
+    operator: str
+    right: Optional[IRNode]
     
     def __init__(self, left: IRNode, operator: str, right: IRNode,
                  result_type: IRType = IRType.ANY):
@@ -240,8 +359,10 @@ class IRBinaryOp(IRNode):
 @dataclass
 class IRUnaryOp(IRNode):
     """IR Unary operation node."""
-    operator: str = ""
-    operand: Optional[IRNode] = None
+    __slots__ = ('operator', 'operand')
+    
+    operator: str
+    operand: Optional[IRNode]
     
     def __init__(self, operator: str, operand: IRNode,
                  result_type: IRType = IRType.ANY):
@@ -253,8 +374,10 @@ class IRUnaryOp(IRNode):
 @dataclass
 class IRLiteral(IRNode):
     """IR Literal value node."""
-    value: Any = None
-    literal_type: IRType = IRType.ANY
+    __slots__ = ('value', 'literal_type')
+    
+    value: Any
+    literal_type: IRType
     
     def __init__(self, value: Any, literal_type: IRType):
         super().__init__(IRNodeType.LITERAL, literal_type)
@@ -265,7 +388,9 @@ class IRLiteral(IRNode):
 @dataclass
 class IRIdentifier(IRNode):
     """IR Identifier node."""
-    name: str = ""
+    __slots__ = ('name',)
+    
+    name: str
     
     def __init__(self, name: str, id_type: IRType = IRType.ANY):
         super().__init__(IRNodeType.IDENTIFIER, id_type)
@@ -275,7 +400,9 @@ class IRIdentifier(IRNode):
 @dataclass
 class IRBlock(IRNode):
     """IR Block of statements."""
-    statements: List[IRNode] = field(default_factory=list)
+    __slots__ = ('statements',)
+    
+    statements: List[IRNode]
     
     def __init__(self, statements: List[IRNode] = None):
         super().__init__(IRNodeType.BLOCK)
@@ -285,6 +412,7 @@ class IRBlock(IRNode):
 @dataclass
 class IRBreak(IRNode):
     """IR Break statement node."""
+    __slots__ = ()
     
     def __init__(self):
         super().__init__(IRNodeType.BREAK)
@@ -2,11 +2,63 @@
 Base lexer class with common functionality.
 """
 
-from typing import List, Optional, Set, Any
+import re
+from typing import Dict, List, Optional, Pattern, Set, Any
 from abc import ABC, abstractmethod
 from .token import Token, TokenType
 
 
+# Digits with at most one decimal point; a second point ends the number
+_NUMBER_RE = re.compile(r'\d*(?:\.\d*)?')
+
+# Letters, digits and underscores (same characters as str.isalnum() or '_')
+_IDENTIFIER_RE = re.compile(r'\w*')
+
+# Runs of string characters needing no escape handling, by quote character
+_STRING_CHUNK_RES: Dict[str, Pattern[str]] = {
+    '"': re.compile(r'[^"\\]+'),
+    "'": re.compile(r"[^'\\]+"),
+}
+
+# Escape sequences with special meaning; any other escaped character stands for itself
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+# A backslash escape inside a string body matched by a master token regex
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+
+def _unescape(match: re.Match) -> str:
+    """Replacement for one _ESCAPE_RE match."""
+    char = match.group(1)
+    return _ESCAPES.get(char, char)
+
+
+def compile_token_pattern(operators: Dict[str, TokenType], preprocessor: bool = False) -> Pattern[str]:
+    """
+    Build the master regex used by BaseLexer.scan for C-family source.
+    
+    Args:
+        operators: Operator and delimiter texts mapped to their token types
+        preprocessor: Whether '#' starts a directive token running to end of line
+        
+    Returns:
+        Compiled pattern with one named group per kind of match
+    """
+    # Longest operators first so '<<' wins over '<'
+    ops = '|'.join(map(re.escape, sorted(operators, key=len, reverse=True)))
+    groups = [
+        r'(?P<skip>[ \t\n\r]+|//[^\n]*|/\*(?:.*?\*/|.*))',
+        r'(?P<directive>\#(?P<directive_name>[^\W\d]*)[^\n]*)' if preprocessor else None,
+        r'(?P<number>\d+(?:\.\d*)?)',
+        r'(?P<string>"(?P<dq_body>(?:[^"\\]+|\\.)*)["\\]?'
+        r"|'(?P<sq_body>(?:[^'\\]+|\\.)*)['\\]?)",
+        r'(?P<identifier>[^\W\d]\w*)',
+        f'(?P<operator>{ops})',
+        r'(?P<unknown>.)',
+    ]
+    return re.compile('|'.join(g for g in groups if g), re.DOTALL)
+
+
 class BaseLexer(ABC):
     """
     Abstract base class for all lexers.
@@ -60,23 +112,21 @@ class BaseLexer(ABC):
         """Check if character is alphanumeric or underscore."""
         return char.isalnum() or char == '_'
 
+    def _advance_to(self, end: int) -> None:
+        """Move 'pos' to 'end' in one step, updating 'column' exactly as repeated advance() calls would."""
+        last = self.length - 1
+        self.column += max(0, min(end, last) - self.pos)
+        self.pos = end
+        self.current_char = self.source_code[end] if end <= last else None
+
     def read_number(self) -> Token:
         """Read a number (integer or float)."""
         start_line = self.line
         start_column = self.column
-        result = ''
-        is_float = False
-        
-        while self.current_char is not None and (self.is_digit(self.current_char) or self.current_char == '.'):
-            if self.current_char == '.':
-                if is_float:
-                    break  # Second decimal point
-                is_float = True
-            
-            result += self.current_char
-            self.advance()
+        result = _NUMBER_RE.match(self.source_code, self.pos).group()
+        self._advance_to(self.pos + len(result))
             
-        if is_float:
+        if '.' in result:
             return Token(TokenType.FLOAT, float(result), start_line, start_column)
         return Token(TokenType.INTEGER, int(result), start_line, start_column)
 
@@ -84,48 +134,87 @@ class BaseLexer(ABC):
         """Read a string literal enclosed in quote_char."""
         start_line = self.line
         start_column = self.column
-        result = ''
-        self.advance()  # Skip opening quote
+        source = self.source_code
+        length = self.length
+        chunk_re = _STRING_CHUNK_RES[quote_char]
+        parts = []
+        pos = self.pos + 1  # Skip opening quote
         
-        while self.current_char is not None and self.current_char != quote_char:
-            if self.current_char == '\\':
-                self.advance()
-                if self.current_char == 'n':
-                    result += '\n'
-                elif self.current_char == 't':
-                    result += '\t'
-                elif self.current_char == 'r':
-                    result += '\r'
-                elif self.current_char == '\\':
-                    result += '\\'
-                elif self.current_char == '"':
-                    result += '"'
-                elif self.current_char == "'":
-                    result += "'"
-                else:
-                    result += self.current_char
-            else:
-                result += self.current_char
-            self.advance()
-            
-        if self.current_char == quote_char:
-            self.advance()  # Skip closing quote
-            
-        return Token(TokenType.STRING, result, start_line, start_column)
+        while pos < length:
+            # Copy the run of plain characters up to the next quote or escape
+            match = chunk_re.match(source, pos)
+            if match is not None:
+                parts.append(match.group())
+                pos = match.end()
+                if pos >= length:
+                    break
+            if source[pos] == quote_char:
+                pos += 1  # Skip closing quote
+                break
+            pos += 1  # Skip backslash
+            if pos < length:
+                char = source[pos]
+                parts.append(_ESCAPES.get(char, char))
+                pos += 1
+        
+        self._advance_to(pos)
+        return Token(TokenType.STRING, ''.join(parts), start_line, start_column)
 
     def read_identifier(self, keywords: Set[str]) -> Token:
         """Read an identifier or keyword."""
         start_line = self.line
         start_column = self.column
-        result = ''
-        
-        while self.current_char is not None and self.is_alnum(self.current_char):
-            result += self.current_char
-            self.advance()
+        result = _IDENTIFIER_RE.match(self.source_code, self.pos).group()
+        self._advance_to(self.pos + len(result))
             
         token_type = TokenType.KEYWORD if result in keywords else TokenType.IDENTIFIER
         return Token(token_type, result, start_line, start_column)
         
+    def scan(self, token_re: Pattern[str], operators: Dict[str, TokenType],
+             keywords: Set[str]) -> List[Token]:
+        """
+        Tokenize the rest of the source with a regex from compile_token_pattern().
+        
+        The regex engine does the per-character work; this loop only runs once per
+        token. Whitespace, comments and unknown characters produce no tokens.
+        """
+        source = self.source_code
+        line = self.line
+        base_column = self.column - self.pos
+        tokens = self.tokens
+        append = tokens.append
+        
+        for match in token_re.finditer(source, self.pos):
+            kind = match.lastgroup
+            if kind == 'identifier':
+                text = match.group()
+                token_type = TokenType.KEYWORD if text in keywords else TokenType.IDENTIFIER
+                append(Token(token_type, text, line, match.start() + base_column))
+            elif kind == 'operator':
+                text = match.group()
+                # Operators are positioned like make_token() after consuming them
+                append(Token(operators[text], text, line, match.start() + base_column - len(text)))
+            elif kind == 'number':
+                text = match.group()
+                if '.' in text:
+                    append(Token(TokenType.FLOAT, float(text), line, match.start() + base_column))
+                else:
+                    append(Token(TokenType.INTEGER, int(text), line, match.start() + base_column))
+            elif kind == 'string':
+                body = match.group('dq_body')
+                if body is None:
+                    body = match.group('sq_body')
+                if '\\' in body:
+                    body = _ESCAPE_RE.sub(_unescape, body)
+                append(Token(TokenType.STRING, body, line, match.start() + base_column))
+            elif kind == 'directive':
+                append(Token(TokenType.KEYWORD, '#' + match.group('directive_name'),
+                             line, match.start() + base_column))
+        
+        self._advance_to(self.length)
+        append(Token(TokenType.EOF, None, self.line, self.column))
+        return tokens
+
     def make_token(self, type: TokenType, value: Any) -> Token:
         """Helper to create a token at the current position (corrected for length)."""
         # Note: This helper assumes the token was just consumed, so we might need to adjust
@@ -7,6 +7,41 @@ from .base_lexer import BaseLexer
 from .token import Token, TokenType, PYTHON_KEYWORDS
 
 
+# Two-character operators, keyed by their text
+_TWO_CHAR_OPERATORS = {
+    '==': TokenType.EQUAL,
+    '!=': TokenType.NOT_EQUAL,
+    '<=': TokenType.LESS_EQUAL,
+    '>=': TokenType.GREATER_EQUAL,
+    '**': TokenType.POWER,
+    '//': TokenType.FLOOR_DIVIDE,
+    '+=': TokenType.PLUS_ASSIGN,
+    '-=': TokenType.MINUS_ASSIGN,
+    '->': TokenType.ARROW,
+}
+
+# Single-character operators and delimiters
+_SINGLE_CHAR_OPERATORS = {
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE,
+    '%': TokenType.MODULO,
+    '=': TokenType.ASSIGN,
+    '<': TokenType.LESS_THAN,
+    '>': TokenType.GREATER_THAN,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+    ':': TokenType.COLON,
+    '.': TokenType.DOT,
+}
+
 class PythonLexer(BaseLexer):
     """
     Lexer specifically for Python code.
@@ -203,84 +238,17 @@ class PythonLexer(BaseLexer):
                 continue
             
             # Two-character operators
-            if self.current_char == '=' and self.peek() == '=':
-                self.tokens.append(self.make_token(TokenType.EQUAL, '=='))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char == '!' and self.peek() == '=':
-                self.tokens.append(self.make_token(TokenType.NOT_EQUAL, '!='))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char == '<' and self.peek() == '=':
-                self.tokens.append(self.make_token(TokenType.LESS_EQUAL, '<='))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char == '>' and self.peek() == '=':
-                self.tokens.append(self.make_token(TokenType.GREATER_EQUAL, '>='))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char == '*' and self.peek() == '*':
-                self.tokens.append(self.make_token(TokenType.POWER, '**'))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char == '/' and self.peek() == '/':
-                self.tokens.append(self.make_token(TokenType.FLOOR_DIVIDE, '//'))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char == '+' and self.peek() == '=':
-                self.tokens.append(self.make_token(TokenType.PLUS_ASSIGN, '+='))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char == '-' and self.peek() == '=':
-                self.tokens.append(self.make_token(TokenType.MINUS_ASSIGN, '-='))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char == '-' and self.peek() == '>':
-                self.tokens.append(self.make_token(TokenType.ARROW, '->'))
+            pair = self.source_code[self.pos:self.pos + 2]
+            token_type = _TWO_CHAR_OPERATORS.get(pair)
+            if token_type is not None:
+                self.tokens.append(self.make_token(token_type, pair))
                 self.advance()
                 self.advance()
                 continue
             
             # Single-character operators and delimiters
-            single_char_tokens = {
-                '+': TokenType.PLUS,
-                '-': TokenType.MINUS,
-                '*': TokenType.MULTIPLY,
-                '/': TokenType.DIVIDE,
-                '%': TokenType.MODULO,
-                '=': TokenType.ASSIGN,
-                '<': TokenType.LESS_THAN,
-                '>': TokenType.GREATER_THAN,
-                '(': TokenType.LPAREN,
-                ')': TokenType.RPAREN,
-                '{': TokenType.LBRACE,
-                '}': TokenType.RBRACE,
-                '[': TokenType.LBRACKET,
-                ']': TokenType.RBRACKET,
-                ',': TokenType.COMMA,
-                ';': TokenType.SEMICOLON,
-                ':': TokenType.COLON,
-                '.': TokenType.DOT,
-            }
-            
-            if self.current_char in single_char_tokens:
-                token_type = single_char_tokens[self.current_char]
+            token_type = _SINGLE_CHAR_OPERATORS.get(self.current_char)
+            if token_type is not None:
                 self.tokens.append(self.make_token(token_type, self.current_char))
                 self.advance()
                 continue
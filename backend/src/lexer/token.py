@@ -73,6 +73,9 @@ class TokenType(Enum):
 
 @dataclass
 class Token:
+    # Slots instead of a per-instance __dict__; lexers create one per token
+    __slots__ = ('type', 'value', 'line', 'column')
+    
     type: TokenType
     value: Any
     line: int
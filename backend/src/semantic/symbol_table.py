@@ -114,6 +114,12 @@ class SymbolTable:
         self.current_scope = self.global_scope
         self.scopes: List[Scope] = [self.global_scope]
     
+    def reset(self) -> None:
+        """Drop all scopes and symbols, keeping the same global scope object."""
+        self.global_scope.symbols.clear()
+        self.current_scope = self.global_scope
+        del self.scopes[1:]
+    
     def enter_scope(self, name: str) -> None:
         """
         Enter a new scope.
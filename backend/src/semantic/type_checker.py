@@ -40,6 +40,14 @@ class TypeChecker:
             "cpp": {"int", "float", "double", "bool", "char", "void", "string", "long", "short"}
         }
     
+    def reset(self) -> None:
+        """Clear all state from a previous check so the checker can be reused."""
+        self.symbol_table.reset()
+        self.errors.clear()
+        self.warnings.clear()
+        self.current_function = None
+        self.current_class = None
+    
     def check(self, ast: Program) -> bool:
         """
         Check the AST for semantic errors.